@@ -90,12 +90,17 @@ def crawl(output_format, output_dir, delay, max_pages, verbose, config, use_data
         
         # Override database setting if specified
         if not use_database and hasattr(crawler, 'db_manager'):
+            if crawler.db_manager:
+                crawler.db_manager.close()
             crawler.db_manager = None
             crawler.use_database = False
             logger.info("Database storage disabled")
         
         # Run crawler
-        results = crawler.crawl()
+        try:
+            results = crawler.crawl()
+        finally:
+            crawler.close()
         
         # Save results to files
         if results:
@@ -123,16 +128,13 @@ def db_stats(db_path):
         setup_logging('INFO')
         logger = logging.getLogger(__name__)
         
-        db_manager = PowerSpecDatabaseManager(db_path)
-        
-        # Get basic count
-        count = db_manager.get_cpu_count()
+        with PowerSpecDatabaseManager(db_path) as db_manager:
+            # Get basic count and, for a non-empty database, power statistics
+            count = db_manager.get_cpu_count()
+            stats = db_manager.get_power_statistics() if count > 0 else {}
         logger.info(f"Total CPUs in database: {count}")
         
         if count > 0:
-            # Get power statistics
-            stats = db_manager.get_power_statistics()
-            
             print(f"\n📊 DATABASE STATISTICS")
             print(f"{'='*50}")
             print(f"Total CPUs: {count}")
@@ -177,9 +179,8 @@ def export_modeling_data(db_path, output):
         setup_logging('INFO')
         logger = logging.getLogger(__name__)
         
-        db_manager = PowerSpecDatabaseManager(db_path)
-        
-        success = db_manager.export_for_modeling(output)
+        with PowerSpecDatabaseManager(db_path) as db_manager:
+            success = db_manager.export_for_modeling(output)
         if success:
             logger.info(f"Successfully exported modeling data to {output}")
         else:
@@ -210,10 +211,9 @@ def clear_db(db_path):
             logger.info(f"Removed existing database: {db_path}")
         
         # Initialize new clean database
-        db_manager = PowerSpecDatabaseManager(db_path)
-        logger.info(f"Created new clean database: {db_path}")
-        
-        count = db_manager.get_cpu_count()
+        with PowerSpecDatabaseManager(db_path) as db_manager:
+            logger.info(f"Created new clean database: {db_path}")
+            count = db_manager.get_cpu_count()
         logger.info(f"Database initialized with {count} CPUs")
         
     except Exception as e:
@@ -232,8 +232,8 @@ def search(db_path, name_pattern):
         
         setup_logging('INFO')
         
-        db_manager = PowerSpecDatabaseManager(db_path)
-        results = db_manager.get_cpu_by_name(name_pattern)
+        with PowerSpecDatabaseManager(db_path) as db_manager:
+            results = db_manager.get_cpu_by_name(name_pattern)
         
         if results:
             print(f"\n🔍 Found {len(results)} CPUs matching '{name_pattern}':")
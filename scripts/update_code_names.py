@@ -9,11 +9,15 @@ This script:
 """
 
 import sqlite3
-import json
+import random
 import re
 from pathlib import Path
 
 
+# "Products formerly <code name>" prefix Intel puts on code name values
+_RE_FORMERLY_PREFIX = re.compile(r'^products\s+formerly\s+', re.IGNORECASE)
+
+
 def clean_code_name(code_name_raw: str) -> str:
     """Clean code name by removing 'Products formerly' prefix.
     
@@ -27,7 +31,7 @@ def clean_code_name(code_name_raw: str) -> str:
         return None
     
     # Remove "Products formerly" prefix (case insensitive)
-    cleaned = re.sub(r'^products\s+formerly\s+', '', code_name_raw, flags=re.IGNORECASE)
+    cleaned = _RE_FORMERLY_PREFIX.sub('', code_name_raw)
     
     # Remove any leading/trailing whitespace
     cleaned = cleaned.strip()
@@ -47,54 +51,54 @@ def update_code_names(db_path: str = 'data/intel_cpu_power_specs.db'):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
+    # One-shot rewrite: if it is interrupted, rerun it. Both pragmas only
+    # apply to this connection, so nothing needs restoring afterwards.
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    
     print("="*80)
     print("Updating code_name field from additional_specs")
     print("="*80)
     
-    # Get all CPUs with their additional_specs
-    cursor.execute("SELECT id, name, additional_specs, code_name FROM cpu_power_specs")
-    rows = cursor.fetchall()
+    cursor.execute("SELECT COUNT(*) FROM cpu_power_specs")
+    total_count = cursor.fetchone()[0]
     
-    print(f"\nFound {len(rows)} CPUs in database")
+    print(f"\nFound {total_count} CPUs in database")
+    
+    # Stream all CPUs with the raw code_name pulled out of additional_specs by
+    # SQLite's JSON functions: general section first (most common), then
+    # essentials, then cpu_specifications; empty strings and non-string
+    # values (which json_extract would return as JSON text) fall through
+    cursor.execute("""
+        SELECT id, name, code_name, json_valid(additional_specs),
+               CASE WHEN json_valid(additional_specs) THEN COALESCE(
+                   CASE WHEN json_type(additional_specs, '$.general.code_name') = 'text'
+                        THEN NULLIF(json_extract(additional_specs, '$.general.code_name'), '') END,
+                   CASE WHEN json_type(additional_specs, '$.essentials.code_name') = 'text'
+                        THEN NULLIF(json_extract(additional_specs, '$.essentials.code_name'), '') END,
+                   CASE WHEN json_type(additional_specs, '$.cpu_specifications.code_name') = 'text'
+                        THEN NULLIF(json_extract(additional_specs, '$.cpu_specifications.code_name'), '') END
+               ) END
+        FROM cpu_power_specs
+        WHERE additional_specs IS NOT NULL AND additional_specs != ''
+    """)
     
     updated_count = 0
-    skipped_count = 0
     not_found_count = 0
+    updates = []
     
-    for cpu_id, name, specs_json, current_code_name in rows:
+    for cpu_id, name, current_code_name, specs_valid, code_name_raw in cursor:
         try:
-            # Parse additional_specs JSON
-            if not specs_json:
-                skipped_count += 1
-                continue
-                
-            specs = json.loads(specs_json)
-            
-            # Extract code_name from multiple possible locations
-            code_name_raw = None
-            
-            # Try general section first (most common)
-            if 'general' in specs and isinstance(specs['general'], dict):
-                code_name_raw = specs['general'].get('code_name')
-            
-            # Try essentials section as fallback
-            if not code_name_raw and 'essentials' in specs and isinstance(specs['essentials'], dict):
-                code_name_raw = specs['essentials'].get('code_name')
-            
-            # Try cpu_specifications as another fallback
-            if not code_name_raw and 'cpu_specifications' in specs and isinstance(specs['cpu_specifications'], dict):
-                code_name_raw = specs['cpu_specifications'].get('code_name')
+            if not specs_valid:
+                raise ValueError("additional_specs is not valid JSON")
             
             if code_name_raw:
                 # Clean the code name
                 code_name_cleaned = clean_code_name(code_name_raw)
                 
                 if code_name_cleaned and code_name_cleaned != ':':
-                    # Update database
-                    cursor.execute(
-                        "UPDATE cpu_power_specs SET code_name = ? WHERE id = ?",
-                        (code_name_cleaned, cpu_id)
-                    )
+                    # Queue the update; all rows are written in one batch below
+                    updates.append((code_name_cleaned, cpu_id))
                     updated_count += 1
                     
                     # Show some examples
@@ -103,37 +107,55 @@ def update_code_names(db_path: str = 'data/intel_cpu_power_specs.db'):
                         print(f"  Raw: '{code_name_raw}'")
                         print(f"  Cleaned: '{code_name_cleaned}'")
                         print(f"  Previous: '{current_code_name}'")
-                else:
-                    skipped_count += 1
             else:
                 not_found_count += 1
                 
         except Exception as e:
             print(f"Error processing CPU {name}: {e}")
-            skipped_count += 1
     
-    # Commit changes
+    # Everything neither updated nor missing a code name was skipped: rows
+    # without additional_specs, invalid JSON or an empty cleaned name
+    skipped_count = total_count - updated_count - not_found_count
+    
+    # Apply all updates with a single prepared statement and commit
+    cursor.executemany(
+        "UPDATE cpu_power_specs SET code_name = ? WHERE id = ?",
+        updates
+    )
     conn.commit()
     
     # Print summary
     print("\n" + "="*80)
     print("Update Summary")
     print("="*80)
-    print(f"Total CPUs: {len(rows)}")
+    print(f"Total CPUs: {total_count}")
     print(f"Updated: {updated_count}")
     print(f"Code name not found: {not_found_count}")
     print(f"Skipped: {skipped_count}")
     print("="*80)
     
-    # Show some examples of updated records
+    # Partial index (also created by PowerSpecDatabaseManager) covering the
+    # sample and distribution queries below
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_code_name ON cpu_power_specs(code_name)
+        WHERE code_name IS NOT NULL AND code_name != ''
+    """)
+    
+    # Show some examples of updated records: sample ids from the index
+    # instead of sorting the whole table by RANDOM()
     print("\nSample of updated code names:")
     cursor.execute("""
-        SELECT name, code_name 
-        FROM cpu_power_specs 
+        SELECT id
+        FROM cpu_power_specs
         WHERE code_name IS NOT NULL AND code_name != ''
-        ORDER BY RANDOM()
-        LIMIT 10
     """)
+    candidate_ids = [row[0] for row in cursor]
+    sample_ids = random.sample(candidate_ids, min(10, len(candidate_ids)))
+    placeholders = ','.join('?' * len(sample_ids))
+    cursor.execute(
+        f"SELECT name, code_name FROM cpu_power_specs WHERE id IN ({placeholders})",
+        sample_ids
+    )
     
     for name, code_name in cursor.fetchall():
         print(f"  {name[:60]:<60} → {code_name}")
@@ -160,43 +160,55 @@ class DatabaseUpdater:
         self.logger.info(f"Adding {stats['total_new']} new products to database...")
         self.logger.info("="*80)
         
+        # The crawler spaces request starts by the delay across its fetch workers
+        self.crawler.delay = self.delay_seconds
+        
         overall_idx = 0
         for family_url, cpu_urls in new_products.items():
             self.logger.info(f"\nProcessing family: {family_url}")
             self.logger.info(f"  New products: {len(cpu_urls)}")
             
-            for cpu_url in cpu_urls:
-                overall_idx += 1
-                try:
-                    self.logger.info(f"  [{overall_idx}/{stats['total_new']}] Crawling: {cpu_url}")
-                    
-                    # Parse the CPU page
-                    cpu_data = self.crawler._scrape_cpu_page(cpu_url)
-                    
-                    if cpu_data:
-                        # Save to database
-                        success = self.db_manager.insert_cpu_specs(cpu_data)
+            # Pages are fetched concurrently while earlier ones are parsed;
+            # if the batch itself fails, the family's remaining URLs count
+            # as failures and the update moves on to the next family
+            processed = 0
+            try:
+                for cpu_url, cpu_data in self.crawler.scrape_pages(cpu_urls):
+                    processed += 1
+                    overall_idx += 1
+                    try:
+                        self.logger.info(f"  [{overall_idx}/{stats['total_new']}] Crawled: {cpu_url}")
                         
-                        if success:
-                            stats['successful'] += 1
-                            self.logger.info(f"    ✓ Added: {cpu_data.get('name', 'Unknown')}")
+                        if cpu_data:
+                            # Save to database
+                            success = self.db_manager.insert_cpu_specs(cpu_data)
+                            
+                            if success:
+                                stats['successful'] += 1
+                                self.logger.info(f"    ✓ Added: {cpu_data.get('name', 'Unknown')}")
+                            else:
+                                stats['skipped'] += 1
+                                self.logger.warning(f"    ⊘ Skipped (already exists)")
                         else:
-                            stats['skipped'] += 1
-                            self.logger.warning(f"    ⊘ Skipped (already exists)")
-                    else:
-                        stats['failed'] += 1
-                        self.logger.warning(f"    ✗ Failed to extract data")
+                            stats['failed'] += 1
+                            self.logger.warning(f"    ✗ Failed to extract data")
                     
-                    # Delay between requests
-                    if overall_idx < stats['total_new']:
-                        time.sleep(self.delay_seconds)
-                        
-                except Exception as e:
-                    stats['failed'] += 1
-                    self.logger.error(f"    ✗ Error: {e}")
+                    except Exception as e:
+                        stats['failed'] += 1
+                        self.logger.error(f"    ✗ Error: {e}")
+            except Exception as e:
+                remaining = len(cpu_urls) - processed
+                stats['failed'] += remaining
+                overall_idx += remaining
+                self.logger.error(f"  ✗ Error crawling family, {remaining} products not processed: {e}")
         
         return stats
     
+    def close(self):
+        """Close the crawler and the database manager."""
+        self.crawler.close()
+        self.db_manager.close()
+    
     def run_update(self, dry_run: bool = False) -> Dict[str, Any]:
         """Run the update process.
         
@@ -344,7 +356,10 @@ def main():
     
     # Run updater
     updater = DatabaseUpdater(delay_seconds=args.delay)
-    results = updater.run_update(dry_run=args.dry_run)
+    try:
+        results = updater.run_update(dry_run=args.dry_run)
+    finally:
+        updater.close()
     
     # Exit with appropriate code
     if 'error' in results:
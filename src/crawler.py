@@ -18,17 +18,19 @@ Example:
 """
 
 import requests
-from bs4 import BeautifulSoup
 import time
 import yaml
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 
-from parser import IntelCpuParser
+from parser import IntelCpuParser, init_parser_worker, parse_page_bytes
 from data_manager import DataManager
 from database_manager import PowerSpecDatabaseManager
-from utils import get_headers, handle_request_error
+from utils import get_session, handle_request_error, RateLimiter, parse_retry_after
 
 
 class IntelCpuCrawler:
@@ -51,6 +53,8 @@ class IntelCpuCrawler:
         self.output_dir = Path(output_dir)
         self.delay = delay
         self.max_pages = max_pages
+        self.fetch_workers = max(1, int(self.config.get('fetch_workers', 1)))
+        self.parse_workers = max(1, int(self.config.get('parse_workers', 1)))
         
         # Initialize components
         self.session = self._create_session()
@@ -69,6 +73,16 @@ class IntelCpuCrawler:
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+    @property
+    def delay(self) -> float:
+        """Configured delay between request starts, in seconds."""
+        return self.rate_limiter.base_interval
+    
+    @delay.setter
+    def delay(self, value: float):
+        # Request starts are spaced by the limiter across fetch threads
+        self.rate_limiter = RateLimiter(value)
+    
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
@@ -89,14 +103,14 @@ class IntelCpuCrawler:
             ],
             'request_timeout': 30,
             'max_retries': 3,
+            'fetch_workers': 1,
+            'parse_workers': 1,
             'user_agent': 'Intel CPU Crawler 1.0'
         }
     
     def _create_session(self) -> requests.Session:
         """Create requests session with proper configuration."""
-        session = requests.Session()
-        session.headers.update(get_headers(self.config.get('user_agent', 'Intel CPU Crawler 1.0')))
-        return session
+        return get_session(self.config.get('user_agent', 'Intel CPU Crawler 1.0'))
     
     def crawl(self) -> List[Dict[str, Any]]:
         """
@@ -116,6 +130,9 @@ class IntelCpuCrawler:
         for base_url in base_urls:
             self.logger.info(f"Crawling base URL: {base_url}")
             
+            # CPUs scraped from this base URL, written to the database in one batch
+            pending_rows = []
+            
             try:
                 # Get CPU listing pages
                 cpu_urls = self._get_cpu_urls(base_url)
@@ -126,27 +143,18 @@ class IntelCpuCrawler:
                     cpu_urls = cpu_urls[:self.max_pages]
                     self.logger.info(f"Limited to {len(cpu_urls)} URLs due to max_pages setting")
                 
-                # Process each CPU URL
-                for i, cpu_url in enumerate(cpu_urls, 1):
+                # Pages are fetched in background threads while earlier ones are parsed
+                for i, (cpu_url, cpu_data) in enumerate(self.scrape_pages(cpu_urls), 1):
                     self.logger.info(f"Processing CPU {i}/{len(cpu_urls)}: {cpu_url}")
                     
                     try:
-                        cpu_data = self._scrape_cpu_page(cpu_url)
                         if cpu_data:
                             all_cpus.append(cpu_data)
                             self.logger.debug(f"Successfully scraped: {cpu_data.get('name', 'Unknown CPU')}")
                             
-                            # Store in database if enabled
+                            # Queue for the database if enabled
                             if self.db_manager:
-                                success = self.db_manager.insert_cpu_specs(cpu_data)
-                                if success:
-                                    self.logger.debug(f"Stored in database: {cpu_data.get('name')}")
-                                else:
-                                    self.logger.debug(f"Skipped duplicate in database: {cpu_data.get('name')}")
-                        
-                        # Rate limiting
-                        if i < len(cpu_urls):  # Don't delay after last request
-                            time.sleep(self.delay)
+                                pending_rows.append(cpu_data)
                             
                     except Exception as e:
                         self.logger.error(f"Error processing CPU URL {cpu_url}: {str(e)}")
@@ -155,6 +163,11 @@ class IntelCpuCrawler:
             except Exception as e:
                 self.logger.error(f"Error processing base URL {base_url}: {str(e)}")
                 continue
+            finally:
+                # Store whatever was scraped, even if the base URL failed part way
+                if pending_rows:
+                    inserted = self.db_manager.insert_cpu_specs_bulk(pending_rows)
+                    self.logger.info(f"Stored {inserted}/{len(pending_rows)} new CPUs in database")
         
         self.logger.info(f"Crawling completed. Total CPUs found: {len(all_cpus)}")
         
@@ -180,30 +193,163 @@ class IntelCpuCrawler:
             if not response:
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            return self.parser.extract_cpu_urls(soup, base_url)
+            return self.parser.extract_cpu_urls(response.content, base_url,
+                                              self._declared_encoding(response))
             
         except Exception as e:
             self.logger.error(f"Error getting CPU URLs from {base_url}: {str(e)}")
             return []
     
-    def _scrape_cpu_page(self, cpu_url: str) -> Optional[Dict[str, Any]]:
+    def scrape_pages(self, cpu_urls: List[str]) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Scrape a batch of CPU pages concurrently, yielding results in URL order.
+        
+        Pages are fetched by fetch_workers threads, with request starts
+        spaced by self.delay, while earlier pages are parsed. All pages in
+        the batch share one scrape timestamp.
+        
+        Args:
+            cpu_urls: CPU specification page URLs
+        
+        Yields:
+            (url, cpu_data) tuples; cpu_data is None if the page failed
+        """
+        scraped_at = datetime.now().isoformat()
+        yield from self._parse_pages(self._fetch_pages(cpu_urls), scraped_at)
+    
+    def _fetch_pages(self, urls: List[str]) -> Iterator[Tuple[str, Optional[requests.Response]]]:
+        """
+        Fetch pages in a thread pool, yielding responses in URL order.
+        
+        At most twice the worker count of fetched pages are held at once,
+        so memory stays bounded while the caller parses.
+        
+        Args:
+            urls: Page URLs to fetch
+        
+        Yields:
+            (url, response) tuples; response is None if the request failed
+        """
+        window = 2 * self.fetch_workers
+        
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+            pending = deque()
+            for url in urls:
+                pending.append((url, executor.submit(self._throttled_request, url)))
+                if len(pending) >= window:
+                    done_url, future = pending.popleft()
+                    yield done_url, future.result()
+            
+            while pending:
+                done_url, future = pending.popleft()
+                yield done_url, future.result()
+    
+    def _parse_pages(self, pages: Iterator[Tuple[str, Optional[requests.Response]]],
+                     scraped_at: str) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Parse fetched pages, in worker processes when parse_workers > 1.
+        
+        Workers receive only the page bytes and return plain dicts; at most
+        twice the worker count of pages are in flight, in URL order.
+        
+        Args:
+            pages: (url, response) tuples from _fetch_pages
+            scraped_at: Batch scrape timestamp
+        
+        Yields:
+            (url, cpu_data) tuples; cpu_data is None if fetching or parsing failed
+        """
+        if self.parse_workers == 1:
+            for url, response in pages:
+                yield url, self._parse_cpu_response(url, response, scraped_at)
+            return
+        
+        window = 2 * self.parse_workers
+        
+        with ProcessPoolExecutor(max_workers=self.parse_workers,
+                                 initializer=init_parser_worker) as executor:
+            pending = deque()
+            for url, response in pages:
+                future = None
+                if response:
+                    future = executor.submit(parse_page_bytes, response.content, url,
+                                             self._declared_encoding(response), scraped_at)
+                pending.append((url, future))
+                if len(pending) >= window:
+                    yield self._parse_result(*pending.popleft())
+            
+            while pending:
+                yield self._parse_result(*pending.popleft())
+    
+    def _parse_result(self, cpu_url: str, future) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Wait for a parse worker result, logging worker failures."""
+        if future is None:
+            return cpu_url, None
+        try:
+            return cpu_url, future.result()
+        except Exception as e:
+            self.logger.error(f"Error scraping CPU page {cpu_url}: {str(e)}")
+            return cpu_url, None
+    
+    def _throttled_request(self, url: str) -> Optional[requests.Response]:
+        """
+        Make a request once the rate limiter allows it.
+        
+        Args:
+            url: URL to request
+        
+        Returns:
+            Response object or None if failed
+        """
+        self.rate_limiter.acquire()
+        try:
+            return self._make_request(url)
+        except Exception as e:
+            # Errors _make_request does not retry (e.g. an unparsable URL)
+            # must not escape the worker and end the whole batch
+            handle_request_error(e, url, self.logger)
+            return None
+    
+    def _scrape_cpu_page(self, cpu_url: str,
+                         scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Scrape individual CPU specification page.
         
         Args:
             cpu_url: URL of CPU specification page
+            scraped_at: Batch scrape timestamp; current time if None
             
         Returns:
             Dictionary containing CPU specifications or None if failed
         """
         try:
             response = self._make_request(cpu_url)
+        except Exception as e:
+            handle_request_error(e, cpu_url, self.logger)
+            return None
+        
+        return self._parse_cpu_response(cpu_url, response, scraped_at)
+    
+    def _parse_cpu_response(self, cpu_url: str, response: Optional[requests.Response],
+                            scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse a fetched CPU specification page.
+        
+        Args:
+            cpu_url: URL of CPU specification page
+            response: Fetched response, or None if the request failed
+            scraped_at: Batch scrape timestamp; current time if None
+        
+        Returns:
+            Dictionary containing CPU specifications or None if failed
+        """
+        try:
             if not response:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            cpu_data = self.parser.parse_cpu_page(soup, cpu_url)
+            cpu_data = self.parser.parse_cpu_page(response.content, cpu_url,
+                                                  self._declared_encoding(response),
+                                                  scraped_at)
             
             return cpu_data
             
@@ -211,6 +357,20 @@ class IntelCpuCrawler:
             self.logger.error(f"Error scraping CPU page {cpu_url}: {str(e)}")
             return None
     
+    @staticmethod
+    def _declared_encoding(response: requests.Response) -> Optional[str]:
+        """
+        Get the charset declared in the Content-Type header, if any.
+        
+        requests falls back to ISO-8859-1 for text/html without a charset,
+        so only an explicit declaration is trusted; otherwise the parser
+        detects the encoding from the page itself.
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if 'charset=' in content_type.lower():
+            return response.encoding
+        return None
+    
     def _make_request(self, url: str) -> Optional[requests.Response]:
         """
         Make HTTP request with error handling and retries.
@@ -226,11 +386,20 @@ class IntelCpuCrawler:
         
         for attempt in range(max_retries):
             try:
+                # Retries wait their turn too, so a Retry-After pause holds
+                if attempt:
+                    self.rate_limiter.acquire()
                 response = self.session.get(url, timeout=timeout)
                 response.raise_for_status()
+                self.rate_limiter.record_success()
                 return response
                 
             except requests.RequestException as e:
+                # Throttled: slow the whole crawl down, not just this retry
+                status_code = getattr(e.response, 'status_code', None)
+                if status_code in (429, 503):
+                    self.rate_limiter.backoff(parse_retry_after(e.response.headers.get('Retry-After')))
+                
                 if attempt == max_retries - 1:
                     handle_request_error(e, url, self.logger)
                     return None
@@ -240,6 +409,12 @@ class IntelCpuCrawler:
         
         return None
     
+    def close(self):
+        """Close the HTTP session and the database manager, if enabled."""
+        self.session.close()
+        if self.db_manager:
+            self.db_manager.close()
+    
     def save_results(self, results: List[Dict[str, Any]], format_type: str = 'json'):
         """
         Save crawling results to file.
@@ -21,12 +21,17 @@ Usage:
 
 import json
 import csv
-import pandas as pd
+import os
 from pathlib import Path
 import logging
 from typing import List, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson  # Optional: native JSON encoder for large exports
+except ImportError:
+    orjson = None
+
 
 class DataManager:
     """Manages data storage and export for scraped CPU data."""
@@ -55,8 +60,11 @@ class DataManager:
         filepath = self.output_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
             self.logger.info(f"Saved {len(data)} records to {filepath}")
             
@@ -82,11 +90,14 @@ class DataManager:
             # Flatten nested dictionaries for CSV
             flattened_data = self._flatten_data(data)
             
-            # Convert to DataFrame
-            df = pd.DataFrame(flattened_data)
+            # Columns in first-seen order across all records
+            fieldnames = list(dict.fromkeys(key for item in flattened_data for key in item))
             
-            # Save to CSV
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            # Stream rows straight to the file; missing fields are left empty
+            with open(filepath, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator=os.linesep)
+                writer.writeheader()
+                writer.writerows(flattened_data)
             
             self.logger.info(f"Saved {len(flattened_data)} records to {filepath}")
             
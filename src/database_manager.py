@@ -5,21 +5,254 @@ Simple SQLite database optimized for power prediction modeling.
 
 import sqlite3
 import json
+import re
 import logging
+import queue
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from datetime import datetime
 
+try:
+    import orjson  # Optional: native JSON encoder for the modeling export
+except ImportError:
+    orjson = None
+
+
+# "Products formerly <code name>" prefix Intel puts on code name values
+_RE_FORMERLY_PREFIX = re.compile(r'^products\s+formerly\s+', re.IGNORECASE)
+
+
+def _clean_code_name(code_name: Any) -> Optional[str]:
+    """Clean code name by removing 'Products formerly' prefix.
+    
+    Args:
+        code_name: Raw code name from Intel (e.g., "Products formerly Lunar Lake")
+        
+    Returns:
+        Cleaned code name (e.g., "Lunar Lake") or None
+    """
+    if not code_name or not isinstance(code_name, str):
+        return None
+    
+    # Remove "Products formerly" prefix (case insensitive)
+    cleaned = _RE_FORMERLY_PREFIX.sub('', code_name)
+    
+    # Remove any leading/trailing whitespace
+    cleaned = cleaned.strip()
+    
+    # Remove trailing colon if present (some Intel pages have ":")
+    cleaned = cleaned.rstrip(':')
+    
+    return cleaned if cleaned and cleaned != ':' else None
+
+
+def _safe_int(value: Any) -> Optional[int]:
+    """Safely convert value to integer."""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, str):
+            # Extract numeric part
+            match = re.search(r'(\d+)', value)
+            if match:
+                return int(match.group(1))
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    """Safely convert value to float."""
+    if value is None:
+        return None
+    try:
+        if isinstance(value, str):
+            # Extract numeric part
+            match = re.search(r'(\d+(?:\.\d+)?)', value)
+            if match:
+                return float(match.group(1))
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Column layout of a cpu_power_specs row written by insert_cpu_specs, in
+# insertion order. The second element names the converter applied to the
+# merged spec value: 'int', 'float', 'code_name' or 'str' (stored as-is).
+_FIELD_SPECS = [
+    # Core specifications
+    ('total_cores', 'int'),
+    ('performance_cores', 'int'),
+    ('efficiency_cores', 'int'),
+    ('total_threads', 'int'),
+    
+    # Frequency specifications
+    ('max_turbo_frequency', 'float'),
+    ('base_frequency', 'float'),
+    ('performance_core_max_frequency', 'float'),
+    ('efficiency_core_max_frequency', 'float'),
+    ('performance_core_base_frequency', 'float'),
+    ('efficiency_core_base_frequency', 'float'),
+    ('turbo_boost_max_frequency', 'float'),
+    
+    # Power specifications
+    ('processor_base_power', 'float'),
+    ('maximum_turbo_power', 'float'),
+    ('minimum_assured_power', 'float'),
+    ('tdp', 'float'),
+    ('configurable_tdp_up', 'float'),
+    ('configurable_tdp_down', 'float'),
+    
+    # Process technology
+    ('lithography', 'str'),
+    ('process_node', 'str'),
+    
+    # Cache specifications
+    ('cache_size', 'float'),
+    ('smart_cache', 'float'),
+    ('l1_cache', 'str'),
+    ('l2_cache', 'str'),
+    ('l3_cache', 'float'),
+    
+    # Memory specifications
+    ('max_memory_size', 'int'),
+    ('memory_channels', 'int'),
+    ('memory_types', 'str'),
+    ('memory_speed', 'int'),
+    
+    # Graphics specifications
+    ('gpu_name', 'str'),
+    ('graphics_max_frequency', 'float'),
+    ('graphics_base_frequency', 'float'),
+    ('xe_cores', 'int'),
+    ('execution_units', 'int'),
+    
+    # AI/NPU specifications
+    ('npu_name', 'str'),
+    ('npu_tops', 'int'),
+    ('overall_tops', 'int'),
+    
+    # Package specifications
+    ('socket', 'str'),
+    ('max_operating_temperature', 'int'),
+    ('package_size', 'str'),
+    ('tjunction', 'int'),
+    
+    # Product information
+    ('code_name', 'code_name'),
+    ('product_collection', 'str'),
+    ('vertical_segment', 'str'),
+    ('launch_date', 'str'),
+    ('instruction_set', 'str'),
+]
+
+_CONVERTERS = {
+    'int': '_safe_int',
+    'float': '_safe_float',
+    'code_name': '_clean_code_name',
+    'str': '',
+}
+
+_SCRAPER_VERSION = '1.0'
+
+
+def _compile_row_builder(field_specs: List[Tuple[str, str]]):
+    """
+    Generate a row builder specialized for the given column layout.
+    
+    The generated function returns the INSERT parameter tuple directly from
+    the merged spec dict, avoiding a per-row intermediate dict.
+    
+    Args:
+        field_specs: (column, converter) pairs in insertion order
+        
+    Returns:
+        Function (url, name, ls, additional_specs_json) -> tuple
+    """
+    values = ['url', 'name']
+    for column, kind in field_specs:
+        values.append(f"{_CONVERTERS[kind]}(ls_get({column!r}))")
+    values.extend(['additional_specs_json', repr(_SCRAPER_VERSION)])
+    
+    source = (
+        "def _build_row(url, name, ls, additional_specs_json):\n"
+        "    ls_get = ls.get\n"
+        f"    return ({', '.join(values)})\n"
+    )
+    namespace = {
+        '_safe_int': _safe_int,
+        '_safe_float': _safe_float,
+        '_clean_code_name': _clean_code_name,
+    }
+    exec(source, namespace)
+    return namespace['_build_row']
+
+
+_build_row = _compile_row_builder(_FIELD_SPECS)
+
+_INSERT_COLUMNS = ['url', 'name'] + [column for column, _ in _FIELD_SPECS] + ['additional_specs', 'scraper_version']
+
+_INSERT_SQL = (
+    f"INSERT INTO cpu_power_specs ({', '.join(_INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _INSERT_COLUMNS)})"
+)
+
+# Group-by dimensions materialized in cpu_power_group_counts: (dim, column)
+_POWER_GROUP_DIMENSIONS = [
+    ('cores', 'total_cores'),
+    ('lithography', 'lithography'),
+]
+
+
+def _power_summary_delta_sql(row: str, sign: int) -> str:
+    """
+    Build trigger statements that add (sign=1) or remove (sign=-1) one row's
+    contribution to the power summary tables.
+    
+    Args:
+        row: Trigger row alias, 'NEW' or 'OLD'
+        sign: +1 to add the row, -1 to remove it
+    
+    Returns:
+        Semicolon-terminated SQL statements for a trigger body
+    """
+    statements = [
+        f'''UPDATE cpu_power_stats_summary
+                SET v_int = v_int + ({sign}), v_real = v_real + ({sign}) * {row}.processor_base_power
+                WHERE k = 'base_power' AND {row}.processor_base_power IS NOT NULL;''',
+        f'''UPDATE cpu_power_stats_summary
+                SET v_int = v_int + ({sign}), v_real = v_real + ({sign}) * {row}.maximum_turbo_power
+                WHERE k = 'turbo_power' AND {row}.processor_base_power IS NOT NULL
+                  AND {row}.maximum_turbo_power IS NOT NULL;''',
+    ]
+    for dim, column in _POWER_GROUP_DIMENSIONS:
+        statements.append(
+            f'''INSERT INTO cpu_power_group_counts (dim, key, cnt)
+                SELECT '{dim}', {row}.{column}, {sign} WHERE {row}.{column} IS NOT NULL
+                ON CONFLICT (dim, key) DO UPDATE SET cnt = cnt + ({sign});'''
+        )
+    if sign < 0:
+        statements.append('DELETE FROM cpu_power_group_counts WHERE cnt <= 0;')
+    return '\n'.join(statements)
+
+
+# Bulk path: duplicates (by URL) are skipped instead of aborting the batch
+_INSERT_OR_IGNORE_SQL = _INSERT_SQL.replace('INSERT INTO', 'INSERT OR IGNORE INTO', 1)
+
+
 
 class PowerSpecDatabaseManager:
     """Simple database manager for Intel CPU power specifications."""
     
-    def __init__(self, db_path: str = 'data/intel_cpu_power_specs.db'):
+    def __init__(self, db_path: str = 'data/intel_cpu_power_specs.db', read_pool_size: int = 4):
         """
         Initialize database manager.
         
         Args:
             db_path: Path to SQLite database file
+            read_pool_size: Maximum number of idle read-only connections kept
         """
         self.db_path = Path(db_path)
         self.logger = logging.getLogger(__name__)
@@ -27,12 +260,62 @@ class PowerSpecDatabaseManager:
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # One writer connection, many pooled read-only connections
+        self._rw_conn = self._connect_rw()
+        self._write_lock = threading.Lock()
+        self._read_pool: queue.LifoQueue = queue.LifoQueue(maxsize=read_pool_size)
+        
         # Initialize database
         self._init_database()
     
+    def _connect_rw(self) -> sqlite3.Connection:
+        """Open the read-write connection and switch the database to WAL."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
+    def _connect_ro(self) -> sqlite3.Connection:
+        """Open a read-only connection for the read pool."""
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+    
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, opening one if the pool is empty."""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect_ro()
+        try:
+            yield conn
+        finally:
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def close(self):
+        """Close the writer connection and all pooled read connections."""
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self._rw_conn.close()
+    
+    def __enter__(self) -> 'PowerSpecDatabaseManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def _init_database(self):
         """Initialize database with power-focused schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write_lock, self._rw_conn as conn:
             cursor = conn.cursor()
             
             # Create main table for CPU power specifications
@@ -124,10 +407,88 @@ class PowerSpecDatabaseManager:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_cores ON cpu_power_specs(total_cores)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_lithography ON cpu_power_specs(lithography)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_product_collection ON cpu_power_specs(product_collection)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_turbo_power ON cpu_power_specs(maximum_turbo_power) '
+                           'WHERE processor_base_power IS NOT NULL')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_code_name ON cpu_power_specs(code_name) "
+                           "WHERE code_name IS NOT NULL AND code_name != ''")
+            
+            # Trigger-maintained aggregates backing get_power_statistics
+            self._init_power_summary(cursor)
             
             conn.commit()
             self.logger.info(f"Database initialized at {self.db_path}")
     
+    def _init_power_summary(self, cursor: sqlite3.Cursor):
+        """Create the power summary tables and the triggers that maintain them."""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cpu_power_stats_summary (
+                k TEXT PRIMARY KEY,
+                v_real REAL,
+                v_int INTEGER
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cpu_power_group_counts (
+                dim TEXT NOT NULL,
+                key NOT NULL,
+                cnt INTEGER NOT NULL,
+                PRIMARY KEY (dim, key)
+            )
+        ''')
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_cpu_power_stats_insert
+            AFTER INSERT ON cpu_power_specs
+            BEGIN
+                {_power_summary_delta_sql('NEW', 1)}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_cpu_power_stats_delete
+            AFTER DELETE ON cpu_power_specs
+            BEGIN
+                {_power_summary_delta_sql('OLD', -1)}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_cpu_power_stats_update
+            AFTER UPDATE OF processor_base_power, maximum_turbo_power, total_cores, lithography
+            ON cpu_power_specs
+            BEGIN
+                {_power_summary_delta_sql('OLD', -1)}
+                {_power_summary_delta_sql('NEW', 1)}
+            END
+        ''')
+        
+        # Seed from a full scan for new or pre-existing databases
+        cursor.execute('SELECT COUNT(*) FROM cpu_power_stats_summary')
+        if cursor.fetchone()[0] < 2:
+            self._rebuild_power_summary(cursor)
+    
+    def _rebuild_power_summary(self, cursor: sqlite3.Cursor):
+        """Recompute the power summary tables from cpu_power_specs."""
+        cursor.execute('DELETE FROM cpu_power_stats_summary')
+        cursor.execute('DELETE FROM cpu_power_group_counts')
+        cursor.execute('''
+            INSERT INTO cpu_power_stats_summary (k, v_real, v_int)
+            SELECT 'base_power', COALESCE(SUM(processor_base_power), 0), COUNT(processor_base_power)
+            FROM cpu_power_specs
+        ''')
+        cursor.execute('''
+            INSERT INTO cpu_power_stats_summary (k, v_real, v_int)
+            SELECT 'turbo_power', COALESCE(SUM(maximum_turbo_power), 0), COUNT(maximum_turbo_power)
+            FROM cpu_power_specs
+            WHERE processor_base_power IS NOT NULL
+        ''')
+        for dim, column in _POWER_GROUP_DIMENSIONS:
+            cursor.execute(f'''
+                INSERT INTO cpu_power_group_counts (dim, key, cnt)
+                SELECT '{dim}', {column}, COUNT(*)
+                FROM cpu_power_specs
+                WHERE {column} IS NOT NULL
+                GROUP BY {column}
+            ''')
+    
     def insert_cpu_specs(self, cpu_data: Dict[str, Any]) -> bool:
         """
         Insert CPU specifications into database.
@@ -139,265 +500,196 @@ class PowerSpecDatabaseManager:
             True if inserted, False if duplicate or error
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Check for duplicates
-                if self._cpu_exists(cursor, cpu_data['url']):
-                    self.logger.info(f"CPU already exists in database: {cpu_data['url']}")
-                    return False
-                
-                # Extract power specifications from the categorized structure
-                specs = cpu_data.get('specifications', {})
-                
-                # Merge specifications from all categories for database insertion
-                all_specs = {}
-                for category in ['essentials', 'cpu_specifications', 'memory_specifications', 
-                               'gpu_specifications', 'npu_specifications', 'expansion_options',
-                               'package_specifications', 'advanced_technologies', 'legacy']:
-                    category_specs = specs.get(category, {})
-                    if isinstance(category_specs, dict):
-                        all_specs.update(category_specs)
-                
-                # Handle core specifications with fallback for older architectures
-                total_cores = self._safe_int(all_specs.get('total_cores'))
-                performance_cores = self._safe_int(all_specs.get('performance_cores'))
-                efficiency_cores = self._safe_int(all_specs.get('efficiency_cores'))
-                
-                # For older Intel processors without P/E core distinction,
-                # assume all cores are performance cores (traditional architecture)
-                is_legacy_architecture = False
-                if total_cores and not performance_cores and not efficiency_cores:
-                    performance_cores = total_cores
-                    efficiency_cores = 0
-                    is_legacy_architecture = True
-                    self.logger.debug(f"Applied legacy core logic: {total_cores} total cores -> {performance_cores}P + {efficiency_cores}E")
-                
-                # Handle frequency specifications with fallback for older architectures
-                max_turbo_freq = self._safe_float(all_specs.get('max_turbo_frequency'))
-                base_freq = self._safe_float(all_specs.get('base_frequency'))
-                p_core_max_freq = self._safe_float(all_specs.get('performance_core_max_frequency'))
-                e_core_max_freq = self._safe_float(all_specs.get('efficiency_core_max_frequency'))
-                p_core_base_freq = self._safe_float(all_specs.get('performance_core_base_frequency'))
-                e_core_base_freq = self._safe_float(all_specs.get('efficiency_core_base_frequency'))
-                
-                # For older processors, map general frequencies to P-core frequencies
-                if is_legacy_architecture:
-                    if max_turbo_freq and not p_core_max_freq:
-                        p_core_max_freq = max_turbo_freq
-                        self.logger.debug(f"Mapped max_turbo_frequency ({max_turbo_freq}) to performance_core_max_frequency")
-                    if base_freq and not p_core_base_freq:
-                        p_core_base_freq = base_freq
-                        self.logger.debug(f"Mapped base_frequency ({base_freq}) to performance_core_base_frequency")
-                
-                # Prepare data for insertion
-                insert_data = {
-                    'url': cpu_data['url'],
-                    'name': cpu_data['name'],
-                    
-                    # Core specifications
-                    'total_cores': total_cores,
-                    'performance_cores': performance_cores,
-                    'efficiency_cores': efficiency_cores,
-                    'total_threads': self._safe_int(all_specs.get('total_threads')),
-                    
-                    # Frequency specifications
-                    'max_turbo_frequency': max_turbo_freq,
-                    'base_frequency': base_freq,
-                    'performance_core_max_frequency': p_core_max_freq,
-                    'efficiency_core_max_frequency': e_core_max_freq,
-                    'performance_core_base_frequency': p_core_base_freq,
-                    'efficiency_core_base_frequency': e_core_base_freq,
-                    'turbo_boost_max_frequency': self._safe_float(all_specs.get('turbo_boost_max_frequency')),
-                    
-                    # Power specifications
-                    'processor_base_power': self._safe_float(all_specs.get('processor_base_power')),
-                    'maximum_turbo_power': self._safe_float(all_specs.get('maximum_turbo_power')),
-                    'minimum_assured_power': self._safe_float(all_specs.get('minimum_assured_power')),
-                    'tdp': self._safe_float(all_specs.get('tdp')),
-                    'configurable_tdp_up': self._safe_float(all_specs.get('configurable_tdp_up')),
-                    'configurable_tdp_down': self._safe_float(all_specs.get('configurable_tdp_down')),
-                    
-                    # Process technology
-                    'lithography': all_specs.get('lithography'),
-                    'process_node': all_specs.get('process_node'),
-                    
-                    # Cache specifications
-                    'cache_size': self._safe_float(all_specs.get('cache_size')),
-                    'smart_cache': self._safe_float(all_specs.get('smart_cache')),
-                    'l1_cache': all_specs.get('l1_cache'),
-                    'l2_cache': all_specs.get('l2_cache'),
-                    'l3_cache': self._safe_float(all_specs.get('l3_cache')),
-                    
-                    # Memory specifications
-                    'max_memory_size': self._safe_int(all_specs.get('max_memory_size')),
-                    'memory_channels': self._safe_int(all_specs.get('memory_channels')),
-                    'memory_types': all_specs.get('memory_types'),
-                    'memory_speed': self._safe_int(all_specs.get('memory_speed')),
-                    
-                    # Graphics specifications
-                    'gpu_name': all_specs.get('gpu_name'),
-                    'graphics_max_frequency': self._safe_float(all_specs.get('graphics_max_frequency')),
-                    'graphics_base_frequency': self._safe_float(all_specs.get('graphics_base_frequency')),
-                    'xe_cores': self._safe_int(all_specs.get('xe_cores')),
-                    'execution_units': self._safe_int(all_specs.get('execution_units')),
-                    
-                    # AI/NPU specifications
-                    'npu_name': all_specs.get('npu_name'),
-                    'npu_tops': self._safe_int(all_specs.get('npu_tops')),
-                    'overall_tops': self._safe_int(all_specs.get('overall_tops')),
-                    
-                    # Package specifications
-                    'socket': all_specs.get('socket'),
-                    'max_operating_temperature': self._safe_int(all_specs.get('max_operating_temperature')),
-                    'package_size': all_specs.get('package_size'),
-                    'tjunction': self._safe_int(all_specs.get('tjunction')),
-                    
-                    # Product information
-                    'code_name': self._clean_code_name(all_specs.get('code_name')),
-                    'product_collection': all_specs.get('product_collection'),
-                    'vertical_segment': all_specs.get('vertical_segment'),
-                    'launch_date': all_specs.get('launch_date'),
-                    'instruction_set': all_specs.get('instruction_set'),
-                    
-                    # Store additional specs as JSON
-                    'additional_specs': json.dumps({
-                        k: v for k, v in specs.items() 
-                        if k != 'legacy' and v  # Store non-legacy, non-empty sections
-                    }),
-                    
-                    # Metadata
-                    'scraper_version': '1.0'
-                }
-                
-                # Build INSERT query
-                columns = ', '.join(insert_data.keys())
-                placeholders = ', '.join(['?' for _ in insert_data])
-                
-                query = f'''
-                    INSERT INTO cpu_power_specs ({columns})
-                    VALUES ({placeholders})
-                '''
-                
-                cursor.execute(query, list(insert_data.values()))
+            with self._write_lock, self._rw_conn as conn:
+                # No existence check up front: the UNIQUE url constraint
+                # rejects duplicates and the transaction is rolled back
+                conn.execute(_INSERT_SQL, self._prepare_row(cpu_data))
                 conn.commit()
                 
                 self.logger.info(f"Successfully inserted CPU: {cpu_data['name']}")
                 return True
                 
         except sqlite3.IntegrityError as e:
-            self.logger.warning(f"Duplicate CPU not inserted: {cpu_data['url']} - {str(e)}")
+            self.logger.info(f"CPU already exists in database: {cpu_data['url']} - {str(e)}")
             return False
         except Exception as e:
             self.logger.error(f"Error inserting CPU data: {str(e)}")
             return False
     
-    def _cpu_exists(self, cursor: sqlite3.Cursor, url: str) -> bool:
-        """Check if CPU with given URL already exists."""
-        cursor.execute('SELECT id FROM cpu_power_specs WHERE url = ?', (url,))
-        return cursor.fetchone() is not None
+    def insert_cpu_specs_bulk(self, cpu_data_list: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert many CPUs in a single transaction.
+        
+        CPUs whose URL already exists are skipped, and a CPU whose data
+        cannot be turned into a row is logged and skipped without losing
+        the rest of the batch. Runs on the manager's read-write connection
+        under the write lock, like insert_cpu_specs.
+        
+        Args:
+            cpu_data_list: Iterable of CPU data dictionaries from parser
+            
+        Returns:
+            Number of CPUs inserted
+        """
+        rows = []
+        for cpu_data in cpu_data_list:
+            try:
+                rows.append(self._prepare_row(cpu_data))
+            except Exception as e:
+                url = cpu_data.get('url') if isinstance(cpu_data, dict) else None
+                self.logger.error(f"Skipping CPU {url} in bulk insert: {str(e)}")
+        
+        try:
+            with self._write_lock:
+                # rowcount sums the rows each INSERT added; unlike
+                # total_changes it leaves out ignored duplicates and the
+                # summary rows written by the power triggers
+                with self._rw_conn as conn:
+                    inserted = conn.executemany(_INSERT_OR_IGNORE_SQL, rows).rowcount
+            
+            self.logger.info(f"Bulk inserted {inserted} CPUs")
+            return inserted
+            
+        except Exception as e:
+            self.logger.error(f"Error bulk inserting CPU data: {str(e)}")
+            return 0
     
-    def _clean_code_name(self, code_name: Any) -> Optional[str]:
-        """Clean code name by removing 'Products formerly' prefix.
+    def _prepare_row(self, cpu_data: Dict[str, Any]) -> Tuple:
+        """
+        Build the INSERT parameter tuple for one CPU.
         
         Args:
-            code_name: Raw code name from Intel (e.g., "Products formerly Lunar Lake")
+            cpu_data: Dictionary containing CPU data from parser
             
         Returns:
-            Cleaned code name (e.g., "Lunar Lake") or None
+            Tuple of column values in _INSERT_COLUMNS order
         """
-        if not code_name or not isinstance(code_name, str):
-            return None
+        # Extract power specifications from the categorized structure
+        specs = cpu_data.get('specifications', {})
+        
+        # Merge specifications from all categories for database insertion
+        all_specs = {}
+        for category in ['essentials', 'cpu_specifications', 'memory_specifications', 
+                       'gpu_specifications', 'npu_specifications', 'expansion_options',
+                       'package_specifications', 'advanced_technologies', 'legacy']:
+            category_specs = specs.get(category, {})
+            if isinstance(category_specs, dict):
+                all_specs.update(category_specs)
+        
+        # Handle core specifications with fallback for older architectures
+        total_cores = _safe_int(all_specs.get('total_cores'))
+        performance_cores = _safe_int(all_specs.get('performance_cores'))
+        efficiency_cores = _safe_int(all_specs.get('efficiency_cores'))
         
-        # Remove "Products formerly" prefix (case insensitive)
-        import re
-        cleaned = re.sub(r'^products\s+formerly\s+', '', code_name, flags=re.IGNORECASE)
+        # For older Intel processors without P/E core distinction,
+        # assume all cores are performance cores (traditional architecture)
+        is_legacy_architecture = False
+        if total_cores and not performance_cores and not efficiency_cores:
+            performance_cores = total_cores
+            efficiency_cores = 0
+            is_legacy_architecture = True
+            self.logger.debug(f"Applied legacy core logic: {total_cores} total cores -> {performance_cores}P + {efficiency_cores}E")
         
-        # Remove any leading/trailing whitespace
-        cleaned = cleaned.strip()
+        # Handle frequency specifications with fallback for older architectures
+        max_turbo_freq = _safe_float(all_specs.get('max_turbo_frequency'))
+        base_freq = _safe_float(all_specs.get('base_frequency'))
+        p_core_max_freq = _safe_float(all_specs.get('performance_core_max_frequency'))
+        p_core_base_freq = _safe_float(all_specs.get('performance_core_base_frequency'))
         
-        # Remove trailing colon if present (some Intel pages have ":")
-        cleaned = cleaned.rstrip(':')
+        # For older processors, map general frequencies to P-core frequencies
+        if is_legacy_architecture:
+            if max_turbo_freq and not p_core_max_freq:
+                p_core_max_freq = max_turbo_freq
+                self.logger.debug(f"Mapped max_turbo_frequency ({max_turbo_freq}) to performance_core_max_frequency")
+            if base_freq and not p_core_base_freq:
+                p_core_base_freq = base_freq
+                self.logger.debug(f"Mapped base_frequency ({base_freq}) to performance_core_base_frequency")
         
-        return cleaned if cleaned and cleaned != ':' else None
+        # Write derived core/frequency values back so the row builder sees them
+        all_specs['total_cores'] = total_cores
+        all_specs['performance_cores'] = performance_cores
+        all_specs['efficiency_cores'] = efficiency_cores
+        all_specs['performance_core_max_frequency'] = p_core_max_freq
+        all_specs['performance_core_base_frequency'] = p_core_base_freq
+        
+        # Store additional specs as compact JSON (NULL when nothing to store)
+        extra_specs = {
+            k: v for k, v in specs.items() 
+            if k != 'legacy' and v  # Store non-legacy, non-empty sections
+        }
+        additional_specs_json = (
+            json.dumps(extra_specs, separators=(',', ':')) if extra_specs else None
+        )
+        
+        return _build_row(cpu_data['url'], cpu_data['name'], all_specs, additional_specs_json)
+    
+    def _clean_code_name(self, code_name: Any) -> Optional[str]:
+        """Clean code name by removing 'Products formerly' prefix."""
+        return _clean_code_name(code_name)
     
     def _safe_int(self, value: Any) -> Optional[int]:
         """Safely convert value to integer."""
-        if value is None:
-            return None
-        try:
-            if isinstance(value, str):
-                # Extract numeric part
-                import re
-                match = re.search(r'(\d+)', value)
-                if match:
-                    return int(match.group(1))
-            return int(float(value))
-        except (ValueError, TypeError):
-            return None
+        return _safe_int(value)
     
     def _safe_float(self, value: Any) -> Optional[float]:
         """Safely convert value to float."""
-        if value is None:
-            return None
-        try:
-            if isinstance(value, str):
-                # Extract numeric part
-                import re
-                match = re.search(r'(\d+(?:\.\d+)?)', value)
-                if match:
-                    return float(match.group(1))
-            return float(value)
-        except (ValueError, TypeError):
-            return None
+        return _safe_float(value)
     
     def get_cpu_count(self) -> int:
         """Get total number of CPUs in database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM cpu_power_specs')
             return cursor.fetchone()[0]
     
     def get_power_statistics(self) -> Dict[str, Any]:
-        """Get power-related statistics from the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        """
+        Get power-related statistics from the database.
+        
+        Counts, sums and distributions are read from the trigger-maintained
+        summary tables; min/max values resolve through indexes.
+        """
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             
             stats = {}
             
             # Power statistics
+            cursor.execute('SELECT k, v_real, v_int FROM cpu_power_stats_summary')
+            summary = {k: (v_real, v_int) for k, v_real, v_int in cursor.fetchall()}
+            base_sum, base_count = summary.get('base_power', (None, 0))
+            turbo_sum, turbo_count = summary.get('turbo_power', (None, 0))
+            avg_base_power = base_sum / base_count if base_count else None
+            avg_turbo_power = turbo_sum / turbo_count if turbo_count else None
+            
+            # One aggregate per subquery so SQLite can answer each from an index
             cursor.execute('''
                 SELECT 
-                    COUNT(*) as total_cpus,
-                    AVG(processor_base_power) as avg_base_power,
-                    MIN(processor_base_power) as min_base_power,
-                    MAX(processor_base_power) as max_base_power,
-                    AVG(maximum_turbo_power) as avg_turbo_power,
-                    MIN(maximum_turbo_power) as min_turbo_power, 
-                    MAX(maximum_turbo_power) as max_turbo_power
-                FROM cpu_power_specs 
-                WHERE processor_base_power IS NOT NULL
+                    (SELECT MIN(processor_base_power) FROM cpu_power_specs),
+                    (SELECT MAX(processor_base_power) FROM cpu_power_specs),
+                    (SELECT MIN(maximum_turbo_power) FROM cpu_power_specs
+                     WHERE processor_base_power IS NOT NULL),
+                    (SELECT MAX(maximum_turbo_power) FROM cpu_power_specs
+                     WHERE processor_base_power IS NOT NULL)
             ''')
             
             row = cursor.fetchone()
-            if row:
-                stats['power'] = {
-                    'total_cpus_with_power_data': row[0],
-                    'avg_base_power_w': round(row[1], 2) if row[1] else None,
-                    'min_base_power_w': row[2],
-                    'max_base_power_w': row[3],
-                    'avg_turbo_power_w': round(row[4], 2) if row[4] else None,
-                    'min_turbo_power_w': row[5],
-                    'max_turbo_power_w': row[6]
-                }
+            stats['power'] = {
+                'total_cpus_with_power_data': base_count,
+                'avg_base_power_w': round(avg_base_power, 2) if avg_base_power else None,
+                'min_base_power_w': row[0],
+                'max_base_power_w': row[1],
+                'avg_turbo_power_w': round(avg_turbo_power, 2) if avg_turbo_power else None,
+                'min_turbo_power_w': row[2],
+                'max_turbo_power_w': row[3]
+            }
             
             # Core count distribution
             cursor.execute('''
-                SELECT total_cores, COUNT(*) as count
-                FROM cpu_power_specs 
-                WHERE total_cores IS NOT NULL
-                GROUP BY total_cores
-                ORDER BY total_cores
+                SELECT key, cnt
+                FROM cpu_power_group_counts
+                WHERE dim = 'cores'
+                ORDER BY key
             ''')
             
             stats['core_distribution'] = {
@@ -406,11 +698,10 @@ class PowerSpecDatabaseManager:
             
             # Process technology distribution
             cursor.execute('''
-                SELECT lithography, COUNT(*) as count
-                FROM cpu_power_specs 
-                WHERE lithography IS NOT NULL
-                GROUP BY lithography
-                ORDER BY count DESC
+                SELECT key, cnt
+                FROM cpu_power_group_counts
+                WHERE dim = 'lithography'
+                ORDER BY cnt DESC
             ''')
             
             stats['process_technology'] = {
@@ -430,7 +721,7 @@ class PowerSpecDatabaseManager:
             True if successful
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read_connection() as conn:
                 cursor = conn.cursor()
                 
                 # Select key fields for power modeling
@@ -477,15 +768,20 @@ class PowerSpecDatabaseManager:
                 output_file = Path(output_path)
                 output_file.parent.mkdir(parents=True, exist_ok=True)
                 
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        'metadata': {
-                            'exported_at': datetime.now().isoformat(),
-                            'total_cpus': len(modeling_data),
-                            'description': 'Intel CPU power specifications for SoC power prediction modeling'
-                        },
-                        'data': modeling_data
-                    }, f, indent=2, ensure_ascii=False)
+                export = {
+                    'metadata': {
+                        'exported_at': datetime.now().isoformat(),
+                        'total_cpus': len(modeling_data),
+                        'description': 'Intel CPU power specifications for SoC power prediction modeling'
+                    },
+                    'data': modeling_data
+                }
+                
+                if orjson is not None:
+                    output_file.write_bytes(orjson.dumps(export, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(output_file, 'w', encoding='utf-8') as f:
+                        json.dump(export, f, indent=2, ensure_ascii=False)
                 
                 self.logger.info(f"Exported {len(modeling_data)} CPUs for modeling to {output_file}")
                 return True
@@ -496,9 +792,9 @@ class PowerSpecDatabaseManager:
     
     def get_cpu_by_name(self, name_pattern: str) -> List[Dict[str, Any]]:
         """Get CPUs matching name pattern."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        with self._read_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row  # Return rows as dictionaries
             
             cursor.execute('''
                 SELECT * FROM cpu_power_specs 
@@ -3,12 +3,594 @@ Intel CPU Parser - HTML parsing utilities
 Handles parsing of Intel CPU specification pages.
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString
+import soupsieve
 import re
 import logging
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin, urlparse
-from utils import normalize_unicode_text
+import functools
+import json
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Union
+from urllib.parse import urljoin, urlparse, unquote
+from utils import normalize_unicode_text, WordCharTable
+
+# Tree builder for BeautifulSoup: libxml2-backed lxml when available,
+# the pure-Python html.parser otherwise
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+# Optional lexbor-backed tree for table and product-info queries on raw pages
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Optional multi-pattern matcher for URL exclusion lists
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional multi-pattern DFA used to prefilter the legacy spec patterns
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Entry points accept either a prebuilt soup or the raw page bytes/text
+PageInput = Union[BeautifulSoup, bytes, str]
+
+# Tags needed for CPU URL discovery on listing pages
+_URL_STRAINER = SoupStrainer(["a", "script", "input"])
+
+# Markup the strainer would drop but URL discovery needs: data-url attributes
+# and the tables, CPU lists and product cards checked by _in_spec_container
+_URL_FULL_TREE_MARKERS = r'data-url|<table|cpu-list|product-card'
+_RE_URL_FULL_TREE = re.compile(_URL_FULL_TREE_MARKERS, re.IGNORECASE)
+_RE_URL_FULL_TREE_BYTES = re.compile(_URL_FULL_TREE_MARKERS.encode(), re.IGNORECASE)
+
+# Listing-page link patterns
+_RE_SKU_SPEC = re.compile(r'/sku/\d+/.*specifications\.html')
+_RE_SPECS = re.compile(r'specifications\.html')
+_RE_PRODUCT_SKU = re.compile(r'/products/sku/')
+_RE_PROC_CPU = re.compile(r'/processors/|/cpu/')
+_RE_CPU_TEXT = re.compile(r'Intel.*(?:Core|Xeon|Pentium|Celeron)', re.I)
+_RE_SPEC_BTN = re.compile(r'(?:view|see)\s+(?:specifications|specs|details)', re.I)
+_RE_JS_URL = re.compile(r'["\']([^"\']*(?:sku|specifications)[^"\']*)["\']')
+_RE_DATA_URL = re.compile(r'.*(?:sku|specifications).*')
+
+# Inline scripts larger than this are analytics/framework bundles that never
+# carry specification URLs
+_MAX_INLINE_SCRIPT_CHARS = 200_000
+_JS_SCRIPT_TYPES = (None, 'text/javascript')
+
+# JSON-LD fields that carry URL strings; other scalar fields are skipped
+URL_KEYS = frozenset({'url', '@id', 'sameAs', 'mainEntityOfPage', 'item', 'href'})
+
+# CPU specification URL patterns used by _is_cpu_url: SKU-based URLs,
+# direct spec pages and product SKU pages
+_RE_SPEC_URL = re.compile(r'/sku/\d+/|specifications\.html|/products/sku/')
+_RE_CPU_FAMILY = re.compile(r'core|xeon|pentium|celeron|atom')
+_RE_CPU_IND = re.compile(r'core|xeon|pentium|celeron|atom|processor')
+
+# Promotional/marketing pages that are never CPU specification pages
+MARKETING_EXCLUDES = [
+    '/products/details/processors.html',  # General processor pages
+    '/products/details/processors/core.html',  # Core family page
+    '/products/details/processors/xeon.html',  # Xeon family page
+    '/products/details/processors/atom.html',  # Atom family page
+    '/products/overview.html',  # Overview pages
+    '/processors/processor-numbers.html',  # General info pages
+    '/products/docs/',  # Documentation pages
+    'where-to-buy',  # Purchase pages
+    'ai-pc',  # AI PC promotional pages
+    '/edge.html',  # Edge computing pages
+    '14th-gen.html'  # Generation overview pages
+]
+
+
+def _build_exclude_matcher():
+    """
+    Build a single-scan matcher for MARKETING_EXCLUDES.
+    
+    Returns:
+        Callable returning True if a lowercased URL contains any exclude
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for exclude in MARKETING_EXCLUDES:
+            automaton.add_word(exclude, exclude)
+        automaton.make_automaton()
+        return lambda url_lower: any(True for _ in automaton.iter(url_lower))
+    
+    # Without pyahocorasick, one alternation regex still scans the URL once
+    pattern = re.compile('|'.join(map(re.escape, MARKETING_EXCLUDES)))
+    return lambda url_lower: pattern.search(url_lower) is not None
+
+
+_is_marketing_url = _build_exclude_matcher()
+
+
+def _fast_text(element) -> str:
+    """
+    Equivalent of element.get_text(strip=True) with a fast path for leaf cells.
+    
+    Args:
+        element: Tag whose text to extract
+    
+    Returns:
+        Stripped text of all strings under the element, joined without separator
+    """
+    string = element.string
+    if type(string) is NavigableString:
+        return string.strip()
+    return ''.join(element.stripped_strings)
+
+# CPU name cleanup
+_RE_SPEC_SUFFIX = re.compile(r'\s*-\s*specifications.*$', re.I)
+_RE_SPECS_SUFFIX = re.compile(r'\s*specs.*$', re.I)
+_RE_META_NAME = re.compile(r'(Intel.*?(?:Core|Xeon).*?)(?:\s*[-|]|$)', re.I)
+
+# CPU name locations, in priority order, compiled once per process
+_HEADER_SELECTORS = tuple(soupsieve.compile(s) for s in [
+    'h1.pdp-product-name',
+    'h1[data-testid="product-name"]',
+    '.product-title h1',
+    'h1.page-title',
+    '.product-header h1',
+    '.specification-header h1',
+    'h1',
+    'h2'
+])
+_META_SELECTORS = tuple(soupsieve.compile(s) for s in [
+    'meta[property="og:title"]',
+    'meta[name="title"]',
+    'meta[name="description"]'
+])
+_BREADCRUMB_SELECTORS = tuple(soupsieve.compile(s) for s in [
+    '.breadcrumbs',
+    '.breadcrumb',
+    'nav[aria-label="breadcrumb"]',
+    '[role="navigation"]'
+])
+
+# Product detail locations, in priority order. Each group is queried with one
+# grouped selector and per-selector matchers that restore the priority.
+def _selector_group(selectors):
+    grouped = ', '.join(selectors)
+    return (
+        selectors,
+        grouped,
+        soupsieve.compile(grouped),
+        tuple(soupsieve.compile(s) for s in selectors),
+    )
+
+
+_PRICE_SELECTORS = _selector_group((
+    '.price',
+    '.product-price',
+    '[data-testid="price"]',
+    '.pdp-price'
+))
+_AVAILABILITY_SELECTORS = _selector_group((
+    '.availability',
+    '.stock-status',
+    '[data-testid="availability"]'
+))
+_DESCRIPTION_SELECTORS = _selector_group((
+    '.product-description',
+    '.pdp-description',
+    '[data-testid="description"]',
+    '.product-overview'
+))
+_RE_PRICE = re.compile(r'\$[\d,]+(?:\.\d{2})?')
+
+# Power-focused legacy specification patterns for SoC power prediction modeling,
+# searched in the lowercased page text
+_LEGACY_SPEC_PATTERN_SOURCES = {
+    # Core specifications (critical for power modeling)
+    'total_cores': r'total cores\s*(\d+)',
+    'performance_cores': r'(?:# of )?performance[- ]cores?\s*(\d+)',
+    'efficiency_cores': r'(?:# of )?(?:low power )?efficient?[- ]cores?\s*(\d+)',
+    'total_threads': r'total threads\s*(\d+)',
+    
+    # Frequencies (critical for power prediction)
+    'max_turbo_frequency': r'max turbo frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'base_frequency': r'(?:processor )?base frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'performance_core_max_frequency': r'performance[- ]core max turbo frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'efficiency_core_max_frequency': r'(?:low power )?efficient?[- ]core max turbo frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'performance_core_base_frequency': r'performance[- ]core base frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'efficiency_core_base_frequency': r'(?:low power )?efficient?[- ]core base frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'turbo_boost_max_frequency': r'intel.*?turbo boost max.*?frequency.*?(\d+(?:\.\d+)?)\s*ghz',
+    
+    # Power specifications (most critical for power modeling)
+    'processor_base_power': r'processor base power\s*(\d+(?:\.\d+)?)\s*w',
+    'maximum_turbo_power': r'maximum turbo power\s*(\d+(?:\.\d+)?)\s*w',
+    'minimum_assured_power': r'minimum assured power\s*(\d+(?:\.\d+)?)\s*w',
+    'tdp': r'tdp\s*(\d+(?:\.\d+)?)\s*w',
+    'configurable_tdp_up': r'configurable tdp[- ]up\s*(\d+(?:\.\d+)?)\s*w',
+    'configurable_tdp_down': r'configurable tdp[- ]down\s*(\d+(?:\.\d+)?)\s*w',
+    
+    # Cache (affects power consumption)
+    'cache_size': r'cache\s*(\d+(?:\.\d+)?)\s*mb',
+    'smart_cache': r'(?:intel )?smart cache\s*(\d+(?:\.\d+)?)\s*mb',
+    'l1_cache': r'l1 cache\s*(\d+(?:\.\d+)?)\s*(?:mb|kb)',
+    'l2_cache': r'l2 cache\s*(\d+(?:\.\d+)?)\s*(?:mb|kb)',
+    'l3_cache': r'l3 cache\s*(\d+(?:\.\d+)?)\s*mb',
+    
+    # Process technology (critical for power characteristics)
+    # Simplified: just look for "Lithography" or "CPU Lithography" label and parse paired value
+    'lithography': r'(?:cpu\s+)?lithography\s*[:\s]+([^\n\r<>]+?)(?=\s*(?:\n|\r|<|$))',
+    
+    # Memory (affects system power)
+    'max_memory_size': r'max memory.*?(\d+)\s*gb',
+    'memory_channels': r'max.*?memory channels\s*(\d+)',
+    'memory_types': r'memory types\s*([^\n\r]+(?:ddr|lpddr)[^\n\r]*)',
+    'memory_speed': r'(?:up to )?(\d+)\s*mt/s',
+    
+    # Graphics power specifications
+    'gpu_name': r'gpu name.*?([^\n\r]+(?:arc|uhd|iris|graphics)[^\n\r]*)',
+    'graphics_max_frequency': r'graphics.*?max.*?frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'graphics_base_frequency': r'graphics.*?base.*?frequency\s*(\d+(?:\.\d+)?)\s*ghz',
+    'xe_cores': r'xe[- ]cores\s*(\d+)',
+    'execution_units': r'execution units\s*(\d+)',
+    
+    # AI/NPU power specifications
+    'npu_name': r'npu name.*?([^\n\r]+ai boost[^\n\r]*)',
+    'npu_tops': r'npu.*?peak tops.*?(\d+)',
+    'overall_tops': r'overall peak tops.*?(\d+)',
+    'ai_boost': r'intel.*?ai boost.*?(\d+)',
+    
+    # Package and thermal (important for power modeling)
+    'socket': r'sockets? supported\s*([a-z0-9]+)',
+    'max_operating_temperature': r'max operating temperature\s*(\d+)\s*°?c',
+    'package_size': r'package size\s*([0-9.x]+mm)',
+    'tjunction': r't.*?junction\s*(\d+)\s*°?c',
+    
+    # Other relevant specs
+    'instruction_set': r'instruction set\s*([0-9]+-bit)',
+    'launch_date': r'launch date\s*([q\d\'\/\-\s]+)',
+    'code_name': r'code name.*?([^\n\r]+)',
+    'product_collection': r'product collection\s*([^\n\r]+)',
+    'vertical_segment': r'vertical segment\s*([^\n\r]+)',
+    
+    # Advanced power features (boolean patterns - return yes/no)
+    'speed_shift': r'(intel.*?speed shift)',
+    'turbo_boost': r'(intel.*?turbo boost)',
+    'enhanced_speedstep': r'(enhanced intel speedstep)',
+    'thermal_monitoring': r'(thermal monitoring)',
+    'configurable_tdp': r'(configurable tdp)',
+}
+
+# Literals every match of a legacy pattern must contain; a pattern is only
+# searched when all of its anchors occur in the page text
+_LEGACY_SPEC_ANCHORS = {
+    'total_cores': ('total cores',),
+    'performance_cores': ('performance',),
+    'efficiency_cores': ('efficien',),
+    'total_threads': ('total threads',),
+    'max_turbo_frequency': ('max turbo frequency',),
+    'base_frequency': ('base frequency',),
+    'performance_core_max_frequency': ('performance', 'core max turbo frequency'),
+    'efficiency_core_max_frequency': ('efficien', 'core max turbo frequency'),
+    'performance_core_base_frequency': ('performance', 'core base frequency'),
+    'efficiency_core_base_frequency': ('efficien', 'core base frequency'),
+    'turbo_boost_max_frequency': ('intel', 'turbo boost max'),
+    'processor_base_power': ('processor base power',),
+    'maximum_turbo_power': ('maximum turbo power',),
+    'minimum_assured_power': ('minimum assured power',),
+    'tdp': ('tdp',),
+    'configurable_tdp_up': ('configurable tdp',),
+    'configurable_tdp_down': ('configurable tdp',),
+    'cache_size': ('cache',),
+    'smart_cache': ('smart cache',),
+    'l1_cache': ('l1 cache',),
+    'l2_cache': ('l2 cache',),
+    'l3_cache': ('l3 cache',),
+    'lithography': ('lithography',),
+    'max_memory_size': ('max memory', 'gb'),
+    'memory_channels': ('max', 'memory channels'),
+    'memory_types': ('memory types', 'ddr'),
+    'memory_speed': ('mt/s',),
+    'gpu_name': ('gpu name',),
+    'graphics_max_frequency': ('graphics', 'frequency', 'ghz'),
+    'graphics_base_frequency': ('graphics', 'frequency', 'ghz'),
+    'xe_cores': ('xe', 'cores'),
+    'execution_units': ('execution units',),
+    'npu_name': ('npu name', 'ai boost'),
+    'npu_tops': ('npu', 'peak tops'),
+    'overall_tops': ('overall peak tops',),
+    'ai_boost': ('intel', 'ai boost'),
+    'socket': ('socket', ' supported'),
+    'max_operating_temperature': ('max operating temperature',),
+    'package_size': ('package size', 'mm'),
+    'tjunction': ('junction',),
+    'instruction_set': ('instruction set', '-bit'),
+    'launch_date': ('launch date',),
+    'code_name': ('code name',),
+    'product_collection': ('product collection',),
+    'vertical_segment': ('vertical segment',),
+    'speed_shift': ('intel', 'speed shift'),
+    'turbo_boost': ('intel', 'turbo boost'),
+    'enhanced_speedstep': ('enhanced intel speedstep',),
+    'thermal_monitoring': ('thermal monitoring',),
+    'configurable_tdp': ('configurable tdp',),
+}
+_LEGACY_SPEC_PATTERNS = tuple(
+    (name, _LEGACY_SPEC_ANCHORS[name], re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+    for name, pattern in _LEGACY_SPEC_PATTERN_SOURCES.items()
+)
+
+
+def _build_legacy_prefilter():
+    """
+    Compile all legacy spec patterns into one Hyperscan block-mode database.
+    
+    Patterns are compiled in prefilter mode, so a pattern reported by a
+    scan may still fail the real regex, but one that is not reported
+    cannot match. Capture groups still come from the Python regexes.
+    
+    Returns:
+        hyperscan.Database, or None when hyperscan is unavailable or rejects a pattern
+    """
+    if hyperscan is None:
+        return None
+    
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE |
+             hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP |
+             hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH)
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[pattern.pattern.encode('utf-8') for _, _, pattern in _LEGACY_SPEC_PATTERNS],
+            ids=list(range(len(_LEGACY_SPEC_PATTERNS))),
+            elements=len(_LEGACY_SPEC_PATTERNS),
+            flags=[flags] * len(_LEGACY_SPEC_PATTERNS),
+        )
+        return database
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Hyperscan legacy prefilter disabled: {str(e)}")
+        return None
+
+
+_LEGACY_PREFILTER = _build_legacy_prefilter()
+
+
+def _legacy_candidates(page_text: str) -> Optional[set]:
+    """
+    Scan the page once and return the indexes of legacy patterns that may match.
+    
+    Args:
+        page_text: Lowercased page text
+    
+    Returns:
+        Set of _LEGACY_SPEC_PATTERNS indexes, or None when no prefilter is available
+    """
+    if _LEGACY_PREFILTER is None:
+        return None
+    
+    try:
+        data = page_text.encode('utf-8')
+    except UnicodeEncodeError:
+        return None
+    
+    candidates = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        candidates.add(pattern_id)
+    
+    _LEGACY_PREFILTER.scan(data, match_event_handler=on_match)
+    return candidates
+
+# Sections for legacy regex specification names
+LEGACY_CATEGORY_MAPPINGS = {
+    'essentials': [
+        'product_collection', 'vertical_segment', 'launch_date', 'code_name', 'instruction_set'
+    ],
+    'cpu_specifications': [
+        'total_cores', 'performance_cores', 'efficiency_cores', 'total_threads',
+        'max_turbo_frequency', 'base_frequency', 'performance_core_max_frequency',
+        'efficiency_core_max_frequency', 'performance_core_base_frequency',
+        'efficiency_core_base_frequency', 'turbo_boost_max_frequency',
+        'cache_size', 'smart_cache', 'l1_cache', 'l2_cache', 'l3_cache', 'lithography'
+    ],
+    'memory_specifications': [
+        'max_memory_size', 'memory_channels', 'memory_types', 'memory_speed'
+    ],
+    'gpu_specifications': [
+        'gpu_name', 'graphics_max_frequency', 'graphics_base_frequency',
+        'xe_cores', 'execution_units'
+    ],
+    'npu_specifications': [
+        'npu_name', 'npu_tops', 'overall_tops', 'ai_boost'
+    ],
+    'expansion_options': [
+        'socket'
+    ],
+    'package_specifications': [
+        'processor_base_power', 'maximum_turbo_power', 'minimum_assured_power',
+        'tdp', 'configurable_tdp_up', 'configurable_tdp_down',
+        'max_operating_temperature', 'package_size', 'tjunction'
+    ],
+    'advanced_technologies': [
+        'speed_shift', 'turbo_boost', 'enhanced_speedstep', 'thermal_monitoring',
+        'configurable_tdp'
+    ]
+}
+_SPEC_TO_CATEGORY = {
+    spec_key: category
+    for category, spec_keys in LEGACY_CATEGORY_MAPPINGS.items()
+    for spec_key in spec_keys
+}
+
+# "Lithography" or "CPU Lithography" label followed by its value
+_LITHO_LABEL_PATTERNS = (
+    re.compile(r'(?:cpu\s+)?lithography\s*[:\s]+([^\n\r<>]+?)(?=\s*(?:\n|\r|<|$))', re.IGNORECASE | re.MULTILINE),
+)
+
+# Specification key and lithography value cleanup
+_KEY_CHAR_TABLE = WordCharTable('-')
+_WS_RX = re.compile(r'\s+')
+_LITHO_PREFIX_RX = re.compile(r'^(?:using|with|on|at|by)\s+', re.IGNORECASE)
+_LITHO_SUFFIX_RX = re.compile(r'\s+(?:process|technology|node|class|generation|finfet|gaafet)$', re.IGNORECASE)
+_BRACKETS_RX = re.compile(r'[\(\)\[\]]')
+
+# Values that carry meaningful lithography information. Forms such as
+# "14nm+", "7 nm FinFET", "Intel 7+", "Samsung 8nm" and "GlobalFoundries
+# 12nm" are covered by the first two entries and need no branch of their own.
+_VALID_LITHO_SOURCES = (
+    r'\d+\s*nm',                     # 14 nm, 10nm, 14nm+, Samsung 8nm, etc.
+    r'intel\s+(?:[3-9]|1[0-9])\b',  # Intel 3, Intel 7, Intel 7+, Intel 10 (not 32/64)
+    r'n\d+[a-z]?\b',                 # N5, N3, N3B (TSMC naming)
+    r'\d+\s*nanometer',             # 7 nanometer
+    r'tsmc\s+n\d+',                 # TSMC N5, N3, etc.
+)
+_LITHO_VALID_RX = re.compile('|'.join(f'(?:{p})' for p in _VALID_LITHO_SOURCES), re.IGNORECASE)
+
+# Intel technologies that look like lithography values but are not processes
+_NON_PROCESS_INTEL_TERMS = frozenset((
+    'intel 64',     # 64-bit instruction set
+    'intel 32',     # 32-bit instruction set
+    'intel x86',    # x86 architecture
+    'intel x64',    # x64 architecture
+    'intel sse',    # SIMD instruction sets
+    'intel avx',    # Advanced Vector Extensions
+    'intel ht',     # Hyper-Threading
+    'intel vt',     # Virtualization Technology
+))
+
+# Key substrings marking lithography rows in spec tables and definition lists
+_TABLE_LITHO_KEYWORDS = (
+    'lithography', 'process', 'technology', 'node',
+    'fabrication', 'manufacturing', 'silicon'
+)
+_DL_LITHO_KEYWORDS = (
+    'lithography', 'process', 'technology', 'node',
+    'fabrication', 'manufacturing'
+)
+
+# Header substrings mapped to sections, checked in order; first hit wins
+_PARENT_SECTION_KEYWORDS = (
+    ('cpu', 'cpu_specifications'),
+    ('processor', 'cpu_specifications'),
+    ('memory', 'memory_specifications'),
+    ('gpu', 'gpu_specifications'),
+    ('graphics', 'gpu_specifications'),
+    ('npu', 'npu_specifications'),
+    ('ai', 'npu_specifications'),
+    ('expansion', 'expansion_options'),
+    ('connectivity', 'expansion_options'),
+    ('package', 'package_specifications'),
+    ('security', 'security_reliability'),
+    ('essential', 'essentials'),
+)
+
+# Intel specification section names, keyed by output category
+SECTION_MAPPINGS = {
+    'essentials': ['essentials', 'essential'],
+    'cpu_specifications': ['cpu specifications', 'processor specifications'],
+    'memory_specifications': ['memory specifications', 'memory specs'],
+    'gpu_specifications': ['gpu specifications', 'graphics specifications'],
+    'npu_specifications': ['npu specifications', 'ai specifications'],
+    'expansion_options': ['expansion options', 'connectivity'],
+    'package_specifications': ['package specifications', 'package specs'],
+    'advanced_technologies': ['advanced technologies', 'features'],
+    'security_reliability': ['security & reliability', 'security'],
+    'supplemental_information': ['supplemental information', 'additional info']
+}
+# Matches a header naming any known section, so one find_all covers them all
+_SECTION_RE = re.compile(
+    '|'.join(re.escape(name) for names in SECTION_MAPPINGS.values() for name in names),
+    re.I
+)
+
+# Structured div specification patterns
+_DIV_SPEC_CLASS_RES = (
+    re.compile(r'class.*spec', re.I),  # specification items
+    re.compile(r'data-.*spec', re.I),  # data specification attributes
+    re.compile(r'class.*detail', re.I),  # detail sections
+)
+_RE_DIV_KEY_CLASS = re.compile(r'key|label|name', re.I)
+_RE_DIV_VALUE_CLASS = re.compile(r'value|detail|data', re.I)
+
+
+# Category keywords in priority order; the first category with any keyword
+# contained in a key wins
+_CATEGORY_KEYWORDS = (
+    ('cpu_specifications', ('core', 'thread', 'frequency', 'turbo', 'cache')),  # CPU related
+    ('memory_specifications', ('memory', 'ddr', 'lpddr', 'channel')),  # Memory related
+    ('gpu_specifications', ('gpu', 'graphics', 'display', 'resolution', 'xe')),  # Graphics related
+    ('npu_specifications', ('npu', 'ai', 'tops', 'neural')),  # AI/NPU related
+    ('package_specifications', ('power', 'tdp', 'watt', 'temperature')),  # Power related
+    ('expansion_options', ('pci', 'thunderbolt', 'usb', 'expansion')),  # Connectivity
+    ('security_reliability', ('security', 'encryption', 'trust', 'guard')),  # Security
+)
+
+
+def _build_categorizer():
+    """
+    Build a single-scan keyword categorizer from _CATEGORY_KEYWORDS.
+    
+    Returns:
+        Callable mapping a lowercased key to its category, 'general' by default
+    """
+    categories = [category for category, _ in _CATEGORY_KEYWORDS]
+    
+    if ahocorasick is not None:
+        # One automaton scan reports every (possibly overlapping) keyword hit
+        automaton = ahocorasick.Automaton()
+        for rank, (_, keywords) in enumerate(_CATEGORY_KEYWORDS):
+            for keyword in keywords:
+                automaton.add_word(keyword, rank)
+        automaton.make_automaton()
+        
+        def categorize(key_lower: str) -> str:
+            ranks = [rank for _, rank in automaton.iter(key_lower)]
+            return categories[min(ranks)] if ranks else 'general'
+        return categorize
+    
+    # Without pyahocorasick, one alternation regex per category
+    category_res = [
+        (category, re.compile('|'.join(map(re.escape, keywords))))
+        for category, keywords in _CATEGORY_KEYWORDS
+    ]
+    
+    def categorize(key_lower: str) -> str:
+        for category, pattern in category_res:
+            if pattern.search(key_lower):
+                return category
+        return 'general'
+    return categorize
+
+
+_categorize_key = _build_categorizer()
+
+
+# Cleaned keys seen on most Intel spec pages, categorized once at import
+_KNOWN_SPEC_KEYS = (
+    'total_cores', 'performance_cores', 'efficiency_cores', 'total_threads',
+    'max_turbo_frequency', 'base_frequency', 'performance_core_max_turbo_frequency',
+    'performance_core_base_frequency', 'efficient_core_max_turbo_frequency',
+    'efficient_core_base_frequency', 'turbo_boost_max_technology_30_frequency',
+    'cache', 'bus_speed', 'processor_base_power', 'maximum_turbo_power',
+    'minimum_assured_power', 'tdp', 'configurable_tdp_up', 'configurable_tdp_down',
+    'tjunction', 'max_operating_temperature', 'max_memory_size', 'memory_types',
+    'max_of_memory_channels', 'max_memory_bandwidth', 'ecc_memory_supported',
+    'gpu_name', 'graphics_max_dynamic_frequency', 'graphics_base_frequency',
+    'execution_units', 'max_resolution_hdmi', 'max_resolution_dp',
+    'of_displays_supported', 'directx', 'opengl', 'opencl', 'npu_name',
+    'overall_peak_tops_int8', 'gaussian_neural_accelerator', 'pci_express_revision',
+    'pci_express_configurations', 'max_of_pci_express_lanes', 'thunderbolt_4',
+    'sockets_supported', 'package_size', 'lithography', 'product_collection',
+    'code_name', 'vertical_segment', 'launch_date', 'instruction_set',
+    'instruction_set_extensions', 'software_guard_extensions_intel_sgx',
+    'trusted_execution', 'os_guard', 'boot_guard', 'total_memory_encryption',
+    'aes_new_instructions', 'execute_disable_bit',
+)
+_KEY_TO_CATEGORY = {key: _categorize_key(key) for key in _KNOWN_SPEC_KEYS}
 
 
 class IntelCpuParser:
@@ -17,48 +599,114 @@ class IntelCpuParser:
     def __init__(self):
         """Initialize the parser."""
         self.logger = logging.getLogger(__name__)
+        # find_all results for the page being parsed, keyed by soup identity
+        # and query; cached tags keep their soup alive so ids are not reused
+        self._soup_cache: Dict[tuple, Any] = {}
+        # selectolax tree for the page being parsed, when built from raw input
+        self._lexbor_tree = None
+    
+    @staticmethod
+    def make_soup(html: Union[bytes, str], encoding: Optional[str] = None,
+                  parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Build a BeautifulSoup tree for a page.
+        
+        Args:
+            html: Raw page bytes (preferred) or decoded text
+            encoding: Known page encoding (e.g. from the HTTP response);
+                passing it skips encoding detection for byte input
+            parse_only: Optional strainer limiting which tags are built
+            
+        Returns:
+            BeautifulSoup object built with the module PARSER
+        """
+        if isinstance(html, bytes) and encoding:
+            return BeautifulSoup(html, PARSER, from_encoding=encoding, parse_only=parse_only)
+        return BeautifulSoup(html, PARSER, parse_only=parse_only)
+    
+    @staticmethod
+    def make_lexbor_tree(html: Union[bytes, str], encoding: Optional[str] = None):
+        """
+        Build a selectolax lexbor tree for a page, if selectolax is installed.
+        
+        Args:
+            html: Raw page bytes or decoded text
+            encoding: Known page encoding; UTF-8 is assumed otherwise
+        
+        Returns:
+            LexborHTMLParser tree, or None when selectolax is unavailable
+        """
+        if LexborHTMLParser is None:
+            return None
+        # lexbor reads UTF-8 bytes directly, saving a decode and str copy
+        if isinstance(html, bytes) and encoding and encoding.lower() not in ('utf-8', 'utf8'):
+            html = html.decode(encoding, errors='replace')
+        return LexborHTMLParser(html)
     
-    def extract_cpu_urls(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    @classmethod
+    def make_soup_for_urls(cls, html: Union[bytes, str],
+                           encoding: Optional[str] = None) -> BeautifulSoup:
+        """
+        Build a soup containing only what CPU URL discovery needs.
+        
+        Anchors, scripts and inputs are kept. Pages carrying data-url
+        attributes, tables, CPU lists or product cards are parsed in full,
+        since data-url can sit on any tag and link context needs ancestors.
+        """
+        marker_re = _RE_URL_FULL_TREE_BYTES if isinstance(html, bytes) else _RE_URL_FULL_TREE
+        parse_only = None if marker_re.search(html) else _URL_STRAINER
+        return cls.make_soup(html, encoding, parse_only)
+    
+    def extract_cpu_urls(self, soup: PageInput, base_url: str,
+                         encoding: Optional[str] = None) -> List[str]:
         """
         Extract CPU detail page URLs from product listing page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            soup: BeautifulSoup object of the page, or the raw page bytes
             base_url: Base URL for resolving relative links
+            encoding: Page encoding, used only when raw bytes are passed
             
         Returns:
             List of CPU detail page URLs
         """
-        cpu_urls = []
+        # Insertion-ordered dict doubles as an order-preserving set
+        cpu_urls: Dict[str, None] = {}
         
         try:
-            # Priority 1: Look for CPU SKU specification pages (most detailed)
-            sku_links = soup.find_all('a', href=re.compile(r'/sku/\d+/.*specifications\.html'))
-            cpu_links = sku_links
+            if not isinstance(soup, BeautifulSoup):
+                soup = self.make_soup_for_urls(soup, encoding)
             
-            # Priority 2: Look for general CPU specification links
-            spec_links = soup.find_all('a', href=re.compile(r'specifications\.html'))
-            cpu_links.extend(spec_links)
+            # Single pass over anchors, bucketing each link by the first
+            # priority it matches so deduplication keeps the same order
+            sku_links = []  # Priority 1: CPU SKU specification pages (most detailed)
+            spec_links = []  # Priority 2: general CPU specification links
+            product_sku_links = []  # Priority 3: product SKU pages
+            traditional_cpu_links = []  # Priority 4: traditional CPU product links (as fallback)
+            cpu_text_links = []  # Priority 5: links with CPU-related text (but filter heavily)
+            spec_button_links = []  # "View Specifications" or "View Details" type links
+            spec_table_links = []  # Links in specification tables or product cards
             
-            # Priority 3: Look for product SKU pages
-            product_sku_links = soup.find_all('a', href=re.compile(r'/products/sku/'))
-            cpu_links.extend(product_sku_links)
+            for link in soup.find_all('a', href=True):
+                href = link['href']
+                text = link.string or ''
+                if _RE_SKU_SPEC.search(href):
+                    sku_links.append(link)
+                elif _RE_SPECS.search(href):
+                    spec_links.append(link)
+                elif _RE_PRODUCT_SKU.search(href):
+                    product_sku_links.append(link)
+                elif _RE_PROC_CPU.search(href):
+                    traditional_cpu_links.append(link)
+                elif _RE_CPU_TEXT.search(text):
+                    cpu_text_links.append(link)
+                elif _RE_SPEC_BTN.search(text):
+                    spec_button_links.append(link)
+                elif ('specifications' in href or 'sku' in href) and self._in_spec_container(link, href):
+                    spec_table_links.append(link)
             
-            # Priority 4: Traditional CPU product links (as fallback)
-            traditional_cpu_links = soup.find_all('a', href=re.compile(r'/processors/|/cpu/'))
-            cpu_links.extend(traditional_cpu_links)
-            
-            # Priority 5: Links with CPU-related text (but filter heavily)
-            cpu_text_links = soup.find_all('a', string=re.compile(r'Intel.*(?:Core|Xeon|Pentium|Celeron)', re.I))
-            cpu_links.extend(cpu_text_links)
-            
-            # Look for "View Specifications" or "View Details" type links
-            spec_button_links = soup.find_all('a', string=re.compile(r'(?:view|see)\s+(?:specifications|specs|details)', re.I))
-            cpu_links.extend(spec_button_links)
-            
-            # Look for links in specification tables or product cards
-            spec_table_links = soup.select('table a[href*="specifications"], .product-card a[href*="sku"], .cpu-list a[href*="specifications"]')
-            cpu_links.extend(spec_table_links)
+            cpu_links = (sku_links + spec_links + product_sku_links + traditional_cpu_links
+                         + cpu_text_links + spec_button_links + spec_table_links)
             
             for link in cpu_links:
                 href = link.get('href')
@@ -68,36 +716,63 @@ class IntelCpuParser:
                     
                     # Filter for CPU-related URLs (now includes US English check)
                     if self._is_cpu_url(full_url):
-                        cpu_urls.append(full_url)
-            
-            # Remove duplicates while preserving order
-            cpu_urls = list(dict.fromkeys(cpu_urls))
+                        cpu_urls[full_url] = None
             
             # Try to find more specification URLs from the page content
-            additional_urls = self._find_specification_urls(soup, base_url)
-            cpu_urls.extend(additional_urls)
-            
-            # Final deduplication
-            cpu_urls = list(dict.fromkeys(cpu_urls))
+            for url in self._find_specification_urls(soup, base_url):
+                cpu_urls[url] = None
             
             # Prioritize specification pages over promotional pages
-            spec_urls = [url for url in cpu_urls if 'specifications.html' in url or '/sku/' in url]
-            other_urls = [url for url in cpu_urls if 'specifications.html' not in url and '/sku/' not in url]
+            spec_urls: Dict[str, None] = {}
+            other_urls: Dict[str, None] = {}
+            for url in cpu_urls:
+                if 'specifications.html' in url or '/sku/' in url:
+                    spec_urls[url] = None
+                else:
+                    other_urls[url] = None
             
             # Return specification URLs first, then others
-            final_urls = spec_urls + other_urls
+            final_urls = list(spec_urls) + list(other_urls)
             
             # Log filtering results
-            self.logger.debug(f"Found {len(spec_urls)} specification URLs and {len(other_urls)} other CPU URLs")
-            self.logger.debug(f"Found {len(final_urls)} total US English CPU URLs out of {len(cpu_links)} total links")
+            self.logger.debug("Found %s specification URLs and %s other CPU URLs", len(spec_urls), len(other_urls))
+            self.logger.debug("Found %s total US English CPU URLs out of %s total links", len(final_urls), len(cpu_links))
             
             return final_urls
             
         except Exception as e:
             self.logger.error(f"Error extracting CPU URLs: {str(e)}")
             return []
+        finally:
+            # Bound memoized URL checks to a single listing page
+            IntelCpuParser._is_cpu_url.cache_clear()
+            IntelCpuParser._is_us_english_url.cache_clear()
+    
+    @staticmethod
+    def _in_spec_container(link, href: str) -> bool:
+        """
+        Check if a link sits in a specification table, product card or CPU list.
+        
+        Args:
+            link: Anchor tag
+            href: The anchor's href attribute
+        
+        Returns:
+            True for specification links in tables or CPU lists and SKU links in product cards
+        """
+        has_specs = 'specifications' in href
+        has_sku = 'sku' in href
+        for parent in link.parents:
+            if has_specs and parent.name == 'table':
+                return True
+            classes = parent.get('class') or ()
+            if (has_specs and 'cpu-list' in classes) or (has_sku and 'product-card' in classes):
+                return True
+        return False
     
-    def _is_cpu_url(self, url: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _is_cpu_url(url: str) -> bool:
         """
         Check if URL appears to be a CPU specification page and is US English.
         Focus on actual CPU spec pages, not promotional content.
@@ -109,10 +784,9 @@ class IntelCpuParser:
             True if URL appears to be a US English CPU specification page
         """
         # First check if it's a US English page
-        if not self._is_us_english_url(url):
-            return False
-        
         url_lower = url.lower()
+        if not IntelCpuParser._is_us_english_url(url_lower):
+            return False
         
         # Priority 1: Actual CPU specification pages (SKU pages)
         if '/sku/' in url_lower and 'specifications.html' in url_lower:
@@ -123,58 +797,34 @@ class IntelCpuParser:
             return True
         
         # Priority 3: Direct specification pages
-        if 'specifications.html' in url_lower and any(cpu in url_lower for cpu in ['core', 'xeon', 'pentium', 'celeron', 'atom']):
+        if 'specifications.html' in url_lower and _RE_CPU_FAMILY.search(url_lower):
             return True
         
-        # Exclude promotional/marketing pages
-        marketing_excludes = [
-            '/products/details/processors.html',  # General processor pages
-            '/products/details/processors/core.html',  # Core family page
-            '/products/details/processors/xeon.html',  # Xeon family page
-            '/products/details/processors/atom.html',  # Atom family page
-            '/products/overview.html',  # Overview pages
-            '/processors/processor-numbers.html',  # General info pages
-            '/products/docs/',  # Documentation pages
-            'where-to-buy',  # Purchase pages
-            'ai-pc',  # AI PC promotional pages
-            '/edge.html',  # Edge computing pages
-            '14th-gen.html'  # Generation overview pages
-        ]
-        
         # Exclude known promotional/marketing pages
-        for exclude in marketing_excludes:
-            if exclude in url_lower:
-                return False
-        
-        # Only allow specific CPU specification patterns
-        cpu_spec_patterns = [
-            r'/sku/\d+/',  # SKU-based URLs
-            r'specifications\.html',  # Direct spec pages
-            r'/products/sku/'  # Product SKU pages
-        ]
-        
-        # Check if URL matches any specification pattern
-        for pattern in cpu_spec_patterns:
-            if re.search(pattern, url_lower):
-                # Additional validation for CPU-related content
-                cpu_indicators = ['core', 'xeon', 'pentium', 'celeron', 'atom', 'processor']
-                if any(indicator in url_lower for indicator in cpu_indicators):
-                    return True
+        if _is_marketing_url(url_lower):
+            return False
+        
+        # Check if URL matches any specification pattern, with additional
+        # validation for CPU-related content
+        if _RE_SPEC_URL.search(url_lower) and _RE_CPU_IND.search(url_lower):
+            return True
         
         # Reject everything else (promotional pages, family pages, etc.)
         return False
     
-    def _is_us_english_url(self, url: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _is_us_english_url(url_lower: str) -> bool:
         """
         Check if URL is a US English Intel page.
         
         Args:
-            url: URL to check
+            url_lower: Lowercased URL to check
             
         Returns:
             True if URL contains /us/en/ path
         """
-        return '/us/en/' in url.lower() and 'intel.com' in url.lower()
+        return '/us/en/' in url_lower and 'intel.com' in url_lower
     
     def _find_specification_urls(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """
@@ -190,24 +840,39 @@ class IntelCpuParser:
         spec_urls = []
         
         try:
-            # Method 1: Look for JavaScript-generated URLs in script tags
-            script_tags = soup.find_all('script')
-            for script in script_tags:
-                if script.string:
-                    # Look for URLs in JavaScript
-                    url_matches = re.findall(r'["\']([^"\']*(?:sku|specifications)[^"\']*)["\']', script.string)
-                    for match in url_matches:
-                        if '/us/en/' in match and ('sku' in match or 'specifications' in match):
-                            full_url = urljoin(base_url, match)
+            # Method 1: Look for JavaScript-generated URLs in inline scripts and
+            # JSON-LD structured data, in a single pass over script tags
+            for script in soup.find_all('script'):
+                script_text = script.string
+                if not script_text:
+                    continue
+                script_type = script.get('type')
+                
+                if script_type == 'application/ld+json':
+                    try:
+                        data = json.loads(script_text)
+                    except ValueError:
+                        continue
+                    # Search for URLs anywhere in the JSON data
+                    for url in self._extract_urls_from_json(data):
+                        full_url = urljoin(base_url, url)
+                        if self._is_us_english_url(full_url.lower()):
                             spec_urls.append(full_url)
+                elif (script_type in _JS_SCRIPT_TYPES and not script.get('src')
+                      and len(script_text) <= _MAX_INLINE_SCRIPT_CHARS):
+                    # Look for URLs in JavaScript
+                    for match in _RE_JS_URL.finditer(script_text):
+                        url = match.group(1)
+                        if '/us/en/' in url and ('sku' in url or 'specifications' in url):
+                            spec_urls.append(urljoin(base_url, url))
             
             # Method 2: Look in data attributes
-            data_links = soup.find_all(attrs={'data-url': re.compile(r'.*(?:sku|specifications).*')})
+            data_links = soup.find_all(attrs={'data-url': _RE_DATA_URL})
             for element in data_links:
                 data_url = element.get('data-url')
                 if data_url:
                     full_url = urljoin(base_url, data_url)
-                    if self._is_us_english_url(full_url):
+                    if self._is_us_english_url(full_url.lower()):
                         spec_urls.append(full_url)
             
             # Method 3: Look for hidden form inputs with URLs
@@ -215,60 +880,59 @@ class IntelCpuParser:
             for inp in hidden_inputs:
                 value = inp.get('value', '')
                 if 'specifications' in value or 'sku' in value:
-                    if value.startswith('http') and self._is_us_english_url(value):
+                    if value.startswith('http') and self._is_us_english_url(value.lower()):
                         spec_urls.append(value)
                     elif value.startswith('/'):
                         full_url = urljoin(base_url, value)
-                        if self._is_us_english_url(full_url):
+                        if self._is_us_english_url(full_url.lower()):
                             spec_urls.append(full_url)
             
-            # Method 4: Look in JSON-LD structured data
-            json_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_scripts:
-                if script.string:
-                    try:
-                        import json
-                        data = json.loads(script.string)
-                        # Recursively search for URLs in the JSON data
-                        urls = self._extract_urls_from_json(data)
-                        for url in urls:
-                            if ('sku' in url or 'specifications' in url) and self._is_us_english_url(url):
-                                spec_urls.append(url)
-                    except (json.JSONDecodeError, Exception):
-                        pass
-        
         except Exception as e:
-            self.logger.debug(f"Error finding specification URLs: {str(e)}")
+            self.logger.debug("Error finding specification URLs: %s", e)
         
         return list(set(spec_urls))  # Remove duplicates
     
     def _extract_urls_from_json(self, data) -> List[str]:
-        """Recursively extract URLs from JSON data."""
+        """Extract URLs from URL-bearing JSON fields using an iterative worklist."""
         urls = []
-        if isinstance(data, dict):
-            for value in data.values():
-                if isinstance(value, str) and ('http' in value or value.startswith('/')):
-                    if 'sku' in value or 'specifications' in value:
-                        urls.append(value)
-                else:
-                    urls.extend(self._extract_urls_from_json(value))
-        elif isinstance(data, list):
-            for item in data:
-                urls.extend(self._extract_urls_from_json(item))
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    # Always descend into containers; keep scalars only under URL keys
+                    if key in URL_KEYS or isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(node)
+            elif (isinstance(node, str) and ('sku' in node or 'specifications' in node)
+                  and (node.startswith('/') or 'http' in node)):
+                urls.append(node)
         return urls
     
-    def parse_cpu_page(self, soup: BeautifulSoup, url: str) -> Optional[Dict[str, Any]]:
+    def parse_cpu_page(self, soup: PageInput, url: str,
+                       encoding: Optional[str] = None,
+                       scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Parse individual CPU specification page.
         
         Args:
-            soup: BeautifulSoup object of the CPU page
+            soup: BeautifulSoup object of the CPU page, or the raw page bytes
             url: URL of the page
+            encoding: Page encoding, used only when raw bytes are passed
+            scraped_at: ISO timestamp shared by a crawl batch; current time if None
             
         Returns:
             Dictionary containing CPU specifications
         """
+        self._soup_cache.clear()
+        self._lexbor_tree = None
+        
         try:
+            if not isinstance(soup, BeautifulSoup):
+                self._lexbor_tree = self.make_lexbor_tree(soup, encoding)
+                soup = self.make_soup(soup, encoding)
+            
             # Extract CPU name with URL context
             cpu_name = self._extract_cpu_name_with_url(soup, url)
             # Normalize Unicode characters in CPU name
@@ -284,8 +948,7 @@ class IntelCpuParser:
             }
             
             # Add timestamp
-            from datetime import datetime
-            cpu_data['scraped_at'] = datetime.now().isoformat()
+            cpu_data['scraped_at'] = scraped_at or datetime.now().isoformat()
             
             return cpu_data
             
@@ -303,14 +966,13 @@ class IntelCpuParser:
         
         # Fallback: extract from URL
         try:
-            from urllib.parse import unquote
-            
             # Intel URLs often contain the CPU name
             # Example: /intel-core-ultra-9-processor-288v-12m-cache-up-to-5-10-ghz/
             url_parts = unquote(url).split('/')
             
             for part in url_parts:
-                if 'intel' in part.lower() and ('core' in part.lower() or 'xeon' in part.lower()):
+                part_lower = part.lower()
+                if 'intel' in part_lower and ('core' in part_lower or 'xeon' in part_lower):
                     # Convert URL slug to readable name
                     name_from_url = part.replace('-', ' ')
                     # Capitalize appropriately
@@ -318,9 +980,10 @@ class IntelCpuParser:
                     formatted_words = []
                     
                     for word in words:
-                        if word.lower() in ['intel', 'core', 'xeon', 'processor']:
+                        word_lower = word.lower()
+                        if word_lower in ('intel', 'core', 'xeon', 'processor'):
                             formatted_words.append(word.capitalize())
-                        elif word.lower().startswith('i') and word[1:].isdigit():
+                        elif word_lower.startswith('i') and word[1:].isdigit():
                             formatted_words.append(f"i{word[1:]}")  # i7, i9, etc.
                         elif word.isdigit() or (word.endswith('v') and word[:-1].isdigit()):
                             formatted_words.append(word.upper())  # 288V, etc.
@@ -332,123 +995,132 @@ class IntelCpuParser:
                         return formatted_name
         
         except Exception as e:
-            self.logger.debug(f"Error extracting name from URL: {str(e)}")
+            self.logger.debug("Error extracting name from URL: %s", e)
         
         return "Unknown CPU"
     
     def _extract_cpu_name(self, soup: BeautifulSoup) -> str:
         """Extract CPU name from Intel's specification pages."""
         
-        # Try multiple strategies to find the CPU name
-        strategies = [
-            self._extract_name_from_title,
-            self._extract_name_from_headers,
-            self._extract_name_from_meta,
-            self._extract_name_from_breadcrumbs,
-            self._extract_name_from_url
-        ]
-        
-        for strategy in strategies:
-            try:
-                name = strategy(soup)
-                if name and len(name) > 5 and 'intel' in name.lower():
-                    return name
-            except Exception as e:
-                self.logger.debug(f"Name extraction strategy failed: {str(e)}")
-                continue
+        # Candidates from title, headers, meta tags and breadcrumbs, in priority order
+        for name in self._collect_name_candidates(soup):
+            if name and len(name) > 5 and 'intel' in name.lower():
+                return name
         
         return "Unknown CPU"
     
-    def _extract_name_from_title(self, soup: BeautifulSoup) -> str:
-        """Extract name from page title."""
-        title = soup.find('title')
-        if title:
+    def _collect_name_candidates(self, soup: BeautifulSoup) -> List[str]:
+        """
+        Collect CPU name candidates from a single walk over the page.
+        
+        Args:
+            soup: BeautifulSoup object of the CPU page
+        
+        Returns:
+            At most one name each from the page title, headers, meta tags and
+            breadcrumb navigation, in that priority order
+        """
+        title = None
+        headers = []  # (selector rank, document position, tag)
+        metas = [None] * len(_META_SELECTORS)
+        breadcrumbs = [None] * len(_BREADCRUMB_SELECTORS)
+        
+        try:
+            for position, tag in enumerate(soup.find_all(True)):
+                tag_name = tag.name
+                if tag_name == 'title':
+                    if title is None:
+                        title = tag
+                elif tag_name in ('h1', 'h2'):
+                    for rank, selector in enumerate(_HEADER_SELECTORS):
+                        if selector.match(tag):
+                            headers.append((rank, position, tag))
+                            break
+                elif tag_name == 'meta':
+                    for rank, selector in enumerate(_META_SELECTORS):
+                        if metas[rank] is None and selector.match(tag):
+                            metas[rank] = tag
+                
+                # Breadcrumb containers are identified by class, role or nav
+                if tag_name == 'nav' or 'class' in tag.attrs or 'role' in tag.attrs:
+                    for rank, selector in enumerate(_BREADCRUMB_SELECTORS):
+                        if breadcrumbs[rank] is None and selector.match(tag):
+                            breadcrumbs[rank] = tag
+        except Exception as e:
+            self.logger.debug("Name candidate collection failed: %s", e)
+        
+        candidates = []
+        
+        # Page title: Intel pages often have the CPU name at the start
+        if title is not None:
             title_text = title.get_text(strip=True)
-            # Intel pages often have the CPU name at the start of title
             if 'intel' in title_text.lower():
                 # Extract the CPU name part (before specifications)
                 name_part = title_text.split('|')[0].strip()
                 # Don't split on hyphen for processor names (i5-110, i7-1234U, etc.)
                 # Only remove specification-related suffixes
-                name_part = re.sub(r'\s*-\s*specifications.*$', '', name_part, flags=re.IGNORECASE)
-                name_part = re.sub(r'\s*specs.*$', '', name_part, flags=re.IGNORECASE)
+                name_part = _RE_SPEC_SUFFIX.sub('', name_part)
+                name_part = _RE_SPECS_SUFFIX.sub('', name_part)
                 if len(name_part) > 10:  # Reasonable length check
-                    return name_part
-        return None
-    
-    def _extract_name_from_headers(self, soup: BeautifulSoup) -> str:
-        """Extract name from page headers."""
-        header_selectors = [
-            'h1.pdp-product-name',
-            'h1[data-testid="product-name"]',
-            '.product-title h1',
-            'h1.page-title',
-            '.product-header h1',
-            '.specification-header h1',
-            'h1',
-            'h2'
-        ]
-        
-        for selector in header_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(strip=True)
-                if text and 'intel' in text.lower() and ('core' in text.lower() or 'xeon' in text.lower() or 'processor' in text.lower()):
-                    # Clean up common suffixes
-                    text = re.sub(r'\s*-\s*specifications.*$', '', text, flags=re.IGNORECASE)
-                    text = re.sub(r'\s*specs.*$', '', text, flags=re.IGNORECASE)
-                    return text
-        
-        return None
-    
-    def _extract_name_from_meta(self, soup: BeautifulSoup) -> str:
-        """Extract name from meta tags."""
-        meta_selectors = [
-            'meta[property="og:title"]',
-            'meta[name="title"]',
-            'meta[name="description"]'
-        ]
-        
-        for selector in meta_selectors:
-            meta = soup.select_one(selector)
-            if meta and meta.get('content'):
-                content = meta.get('content')
-                if 'intel' in content.lower() and ('core' in content.lower() or 'xeon' in content.lower()):
+                    candidates.append(name_part)
+        
+        # Page headers, most specific selector first
+        for _, _, element in sorted(headers, key=lambda h: h[:2]):
+            text = element.get_text(strip=True)
+            text_lower = text.lower()
+            if text and 'intel' in text_lower and ('core' in text_lower or 'xeon' in text_lower or 'processor' in text_lower):
+                # Clean up common suffixes
+                text = _RE_SPEC_SUFFIX.sub('', text)
+                text = _RE_SPECS_SUFFIX.sub('', text)
+                candidates.append(text)
+                break
+        
+        # Meta tags
+        for meta in metas:
+            content = meta.get('content') if meta is not None else None
+            if content:
+                content_lower = content.lower()
+                if 'intel' in content_lower and ('core' in content_lower or 'xeon' in content_lower):
                     # Extract the processor name part
-                    match = re.match(r'(Intel.*?(?:Core|Xeon).*?)(?:\s*[-|]|$)', content, re.IGNORECASE)
+                    match = _RE_META_NAME.match(content)
                     if match:
-                        return match.group(1).strip()
+                        candidates.append(match.group(1).strip())
+                        break
         
-        return None
-    
-    def _extract_name_from_breadcrumbs(self, soup: BeautifulSoup) -> str:
-        """Extract name from breadcrumb navigation."""
-        breadcrumb_selectors = [
-            '.breadcrumbs',
-            '.breadcrumb',
-            'nav[aria-label="breadcrumb"]',
-            '[role="navigation"]'
-        ]
-        
-        for selector in breadcrumb_selectors:
-            breadcrumb = soup.select_one(selector)
-            if breadcrumb:
-                links = breadcrumb.find_all('a')
-                for link in reversed(links):  # Check from end (most specific)
-                    text = link.get_text(strip=True)
-                    if text and 'intel' in text.lower() and len(text) > 10:
-                        return text
+        # Breadcrumb navigation
+        for breadcrumb in breadcrumbs:
+            if breadcrumb is None:
+                continue
+            name = None
+            for link in reversed(breadcrumb.find_all('a')):  # Check from end (most specific)
+                text = link.get_text(strip=True)
+                if text and 'intel' in text.lower() and len(text) > 10:
+                    name = text
+                    break
+            if name:
+                candidates.append(name)
+                break
         
-        return None
+        return candidates
     
-    def _extract_name_from_url(self, soup: BeautifulSoup) -> str:
-        """Extract name from URL structure (fallback)."""
-        try:
-            # This would need the URL to be passed, which we have in parse_cpu_page
-            # For now, return None as this is a fallback method
-            return None
-        except Exception:
-            return None
+    def _find_all_cached(self, soup: BeautifulSoup, *args, **kwargs):
+        """
+        Memoized soup.find_all for queries repeated across extraction strategies.
+        
+        Args:
+            soup: BeautifulSoup object of the page
+            *args: Positional find_all arguments
+            **kwargs: Keyword find_all arguments
+        
+        Returns:
+            find_all result, shared between callers; do not modify
+        """
+        key = (id(soup), args, frozenset(kwargs.items()))
+        result = self._soup_cache.get(key)
+        if result is None:
+            result = soup.find_all(*args, **kwargs)
+            self._soup_cache[key] = result
+        return result
     
     def _extract_specifications(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract comprehensive CPU specifications from Intel's detailed spec pages."""
@@ -474,7 +1146,7 @@ class IntelCpuParser:
             
             # Merge tech-row specs into appropriate categories
             for key, value in tech_row_specs.items():
-                category = self._categorize_specification(key)
+                category = _KEY_TO_CATEGORY.get(key) or self._categorize_specification(key)
                 if category not in specs:
                     specs[category] = {}
                 specs[category][key] = value
@@ -485,26 +1157,24 @@ class IntelCpuParser:
             # Merge table specs into appropriate categories
             for key, value in table_specs.items():
                 # Try to categorize unknown specs
-                category = self._categorize_specification(key)
+                category = _KEY_TO_CATEGORY.get(key) or self._categorize_specification(key)
                 if category not in specs:
                     specs[category] = {}
                 specs[category][key] = value
             
-            # Extract legacy format for backward compatibility
-            legacy_specs = self._extract_legacy_specifications(soup)
+            # Extract legacy format for backward compatibility; the page text is
+            # built once and shared with lithography detection
+            raw_text = soup.get_text()
+            legacy_specs = self._extract_legacy_specifications(soup, raw_text, raw_text.lower())
             if legacy_specs:
-                # Categorize legacy specs into proper sections instead of keeping in legacy
+                # Categorize legacy specs into proper sections instead of keeping in legacy;
+                # every key gets a section (supplemental_information by default), so
+                # no separate 'legacy' bucket is left over
                 categorized_legacy = self._categorize_legacy_specifications(legacy_specs)
                 for category, category_specs in categorized_legacy.items():
                     if category not in specs:
                         specs[category] = {}
                     specs[category].update(category_specs)
-                
-                # Keep only uncategorized specs in legacy
-                uncategorized = {k: v for k, v in legacy_specs.items() 
-                               if not any(k in cat_specs for cat_specs in categorized_legacy.values())}
-                if uncategorized:
-                    specs['legacy'] = uncategorized
             
         except Exception as e:
             self.logger.error(f"Error extracting specifications: {str(e)}")
@@ -520,7 +1190,7 @@ class IntelCpuParser:
         
         try:
             # Find all rows with tech-section-row class (modern Intel page structure)
-            rows = soup.find_all('div', class_='tech-section-row')
+            rows = self._find_all_cached(soup, 'div', class_='tech-section-row')
             
             for row in rows:
                 # Find label and data divs
@@ -528,14 +1198,14 @@ class IntelCpuParser:
                 data_div = row.find('div', class_='tech-data')
                 
                 if label_div and data_div:
-                    key = label_div.get_text(strip=True)
-                    value = data_div.get_text(strip=True)
+                    key = _fast_text(label_div)
+                    value = _fast_text(data_div)
                     
                     if key and value:
                         # Clean the key (remove footnote markers like ‡, †, etc.)
                         clean_key = self._clean_specification_key(key)
                         specs[clean_key] = value
-                        self.logger.debug(f"Extracted from tech-section-row: {clean_key} = {value}")
+                        self.logger.debug("Extracted from tech-section-row: %s = %s", clean_key, value)
         
         except Exception as e:
             self.logger.error(f"Error extracting tech-section-row specifications: {str(e)}")
@@ -546,37 +1216,27 @@ class IntelCpuParser:
         """Extract specifications from Intel's structured sections."""
         sections = {}
         
-        # Define section mappings
-        section_mappings = {
-            'essentials': ['essentials', 'essential'],
-            'cpu_specifications': ['cpu specifications', 'processor specifications'],
-            'memory_specifications': ['memory specifications', 'memory specs'],
-            'gpu_specifications': ['gpu specifications', 'graphics specifications'],
-            'npu_specifications': ['npu specifications', 'ai specifications'],
-            'expansion_options': ['expansion options', 'connectivity'],
-            'package_specifications': ['package specifications', 'package specs'],
-            'advanced_technologies': ['advanced technologies', 'features'],
-            'security_reliability': ['security & reliability', 'security'],
-            'supplemental_information': ['supplemental information', 'additional info']
-        }
-        
         try:
-            # Look for section headers and extract following content
-            for section_key, section_names in section_mappings.items():
+            # Find all section headers in one pass; a header can name more than
+            # one section (e.g. "Security Features")
+            headers_by_section = {}
+            for header in soup.find_all(['h2', 'h3', 'h4'], string=_SECTION_RE):
+                header_lower = header.string.lower()
+                for section_key, section_names in SECTION_MAPPINGS.items():
+                    if any(name in header_lower for name in section_names):
+                        headers_by_section.setdefault(section_key, []).append(header)
+            
+            # Extract the content following each section's headers
+            for section_key in SECTION_MAPPINGS:
                 section_data = {}
-                
-                for section_name in section_names:
-                    # Find section headers
-                    headers = soup.find_all(['h2', 'h3', 'h4'], string=re.compile(section_name, re.IGNORECASE))
-                    
-                    for header in headers:
-                        section_data.update(self._extract_section_content(header))
+                for header in headers_by_section.get(section_key, ()):
+                    section_data.update(self._extract_section_content(header))
                 
                 if section_data:
                     sections[section_key] = section_data
             
             # Extract from definition lists and structured elements
-            dl_elements = soup.find_all('dl')
+            dl_elements = self._find_all_cached(soup, 'dl')
             for dl in dl_elements:
                 dt_dd_pairs = self._extract_dt_dd_pairs(dl)
                 if dt_dd_pairs:
@@ -597,30 +1257,26 @@ class IntelCpuParser:
         content = {}
         
         try:
-            # Find the next sibling elements that contain specifications
-            current = header.find_next_sibling()
-            
-            while current and current.name not in ['h1', 'h2', 'h3', 'h4']:
+            # Walk the following siblings directly until the next header
+            for current in header.next_siblings:
+                name = current.name
+                if name in ('h1', 'h2', 'h3', 'h4'):
+                    break
+                
                 # Extract from tables
-                if current.name == 'table':
+                if name == 'table':
                     table_specs = self._extract_table_content(current)
                     content.update(table_specs)
                 
                 # Extract from definition lists
-                elif current.name == 'dl':
+                elif name == 'dl':
                     dl_specs = self._extract_dt_dd_pairs(current)
                     content.update(dl_specs)
                 
                 # Extract from structured divs
-                elif current.name == 'div':
+                elif name == 'div':
                     div_specs = self._extract_div_specifications(current)
                     content.update(div_specs)
-                
-                current = current.find_next_sibling()
-                
-                # Prevent infinite loops
-                if not current:
-                    break
         
         except Exception as e:
             self.logger.error(f"Error extracting section content: {str(e)}")
@@ -632,16 +1288,11 @@ class IntelCpuParser:
         specs = {}
         
         try:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    key = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
-                    if key and value and key != value:  # Avoid header rows
-                        # Clean and normalize the key
-                        clean_key = self._clean_specification_key(key)
-                        specs[clean_key] = value
+            for key, value in self._table_row_texts(table):
+                if key and value and key != value:  # Avoid header rows
+                    # Clean and normalize the key
+                    clean_key = self._clean_specification_key(key)
+                    specs[clean_key] = value
         
         except Exception as e:
             self.logger.error(f"Error extracting table content: {str(e)}")
@@ -653,17 +1304,10 @@ class IntelCpuParser:
         pairs = {}
         
         try:
-            dt_elements = dl_element.find_all('dt')
-            dd_elements = dl_element.find_all('dd')
-            
-            # Match dt and dd elements
-            for i, dt in enumerate(dt_elements):
-                if i < len(dd_elements):
-                    key = dt.get_text(strip=True)
-                    value = dd_elements[i].get_text(strip=True)
-                    if key and value:
-                        clean_key = self._clean_specification_key(key)
-                        pairs[clean_key] = value
+            for key, value in self._dl_pair_texts(dl_element):
+                if key and value:
+                    clean_key = self._clean_specification_key(key)
+                    pairs[clean_key] = value
         
         except Exception as e:
             self.logger.error(f"Error extracting dt/dd pairs: {str(e)}")
@@ -676,23 +1320,17 @@ class IntelCpuParser:
         
         try:
             # Look for specification patterns in divs
-            spec_patterns = [
-                (r'class.*spec', 'specification items'),
-                (r'data-.*spec', 'data specification attributes'),
-                (r'class.*detail', 'detail sections')
-            ]
-            
-            for pattern, description in spec_patterns:
-                matching_divs = div_element.find_all('div', class_=re.compile(pattern, re.IGNORECASE))
+            for pattern in _DIV_SPEC_CLASS_RES:
+                matching_divs = div_element.find_all('div', class_=pattern)
                 
                 for spec_div in matching_divs:
                     # Extract key-value pairs from the div
-                    key_elem = spec_div.find(class_=re.compile(r'key|label|name', re.IGNORECASE))
-                    value_elem = spec_div.find(class_=re.compile(r'value|detail|data', re.IGNORECASE))
+                    key_elem = spec_div.find(class_=_RE_DIV_KEY_CLASS)
+                    value_elem = spec_div.find(class_=_RE_DIV_VALUE_CLASS)
                     
                     if key_elem and value_elem:
-                        key = key_elem.get_text(strip=True)
-                        value = value_elem.get_text(strip=True)
+                        key = _fast_text(key_elem)
+                        value = _fast_text(value_elem)
                         if key and value:
                             clean_key = self._clean_specification_key(key)
                             specs[clean_key] = value
@@ -702,118 +1340,188 @@ class IntelCpuParser:
         
         return specs
     
+    def _table_key_values(self, soup: BeautifulSoup) -> List[tuple]:
+        """
+        Get the first two cell texts of every table row with at least two cells.
+        
+        Uses the lexbor tree when one was built for the page, BeautifulSoup
+        otherwise. Rows are shared between callers for the current page.
+        
+        Args:
+            soup: BeautifulSoup object of the page
+        
+        Returns:
+            List of (key text, value text) tuples in document order
+        """
+        cache_key = (id(soup), '_table_key_values')
+        rows = self._soup_cache.get(cache_key)
+        if rows is not None:
+            return rows
+        
+        rows = []
+        if self._lexbor_tree is not None:
+            for table in self._lexbor_tree.css('table'):
+                for row in table.css('tr'):
+                    cells = row.css('td, th')
+                    if len(cells) >= 2:
+                        rows.append((cells[0].text(strip=True), cells[1].text(strip=True)))
+        else:
+            for table in self._find_all_cached(soup, 'table'):
+                rows.extend(self._table_row_texts(table))
+        
+        self._soup_cache[cache_key] = rows
+        return rows
+    
+    def _table_row_texts(self, table) -> List[tuple]:
+        """
+        Get the first two cell texts of each row of a table with at least two cells.
+        
+        Memoized per table for the current page, so section and fallback
+        extraction share one text walk per cell.
+        
+        Args:
+            table: Table element
+        
+        Returns:
+            List of (key text, value text) tuples in row order
+        """
+        cache_key = (id(table), '_table_row_texts')
+        entry = self._soup_cache.get(cache_key)
+        if entry is not None:
+            return entry[1]
+        
+        rows = []
+        for row in table.find_all('tr'):
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 2:
+                rows.append((_fast_text(cells[0]), _fast_text(cells[1])))
+        
+        # Holding the element keeps its id from being reused while cached
+        self._soup_cache[cache_key] = (table, rows)
+        return rows
+    
+    def _dl_pair_texts(self, dl_element) -> List[tuple]:
+        """
+        Get the texts of a definition list's dt/dd elements, paired by position.
+        
+        Memoized per list for the current page.
+        
+        Args:
+            dl_element: Definition list element
+        
+        Returns:
+            List of (dt text, dd text) tuples
+        """
+        cache_key = (id(dl_element), '_dl_pair_texts')
+        entry = self._soup_cache.get(cache_key)
+        if entry is not None:
+            return entry[1]
+        
+        dd_elements = dl_element.find_all('dd')
+        pairs = [(_fast_text(dt), _fast_text(dd))
+                 for dt, dd in zip(dl_element.find_all('dt'), dd_elements)]
+        
+        self._soup_cache[cache_key] = (dl_element, pairs)
+        return pairs
+    
+    def _select_first_texts(self, soup: BeautifulSoup, group: tuple) -> List[Optional[str]]:
+        """
+        Get the stripped text of the first element matching each selector of a group.
+        
+        The page is walked once with the grouped selector; each hit fills
+        the slots of the selectors it matches that are still empty.
+        
+        Args:
+            soup: BeautifulSoup object of the page
+            group: Selector group built by _selector_group
+        
+        Returns:
+            One text per selector, in selector order; None where nothing matches
+        """
+        selectors, grouped, grouped_compiled, compiled = group
+        texts: List[Optional[str]] = [None] * len(selectors)
+        remaining = len(selectors)
+        
+        if self._lexbor_tree is not None:
+            for node in self._lexbor_tree.css(grouped):
+                for i, selector in enumerate(selectors):
+                    if texts[i] is None and node.css_matches(selector):
+                        texts[i] = node.text(strip=True)
+                        remaining -= 1
+                if not remaining:
+                    break
+            return texts
+        
+        for element in grouped_compiled.iselect(soup):
+            for i, matcher in enumerate(compiled):
+                if texts[i] is None and matcher.match(element):
+                    texts[i] = element.get_text(strip=True)
+                    remaining -= 1
+            if not remaining:
+                break
+        return texts
+    
     def _extract_table_specifications(self, soup: BeautifulSoup) -> Dict[str, str]:
         """Extract specifications from all tables (fallback method)."""
         specs = {}
         
         try:
-            # Find all tables that might contain specifications
-            tables = soup.find_all('table')
-            
-            for table in tables:
-                table_specs = self._extract_table_content(table)
-                specs.update(table_specs)
+            # Look at every table row that might contain a specification
+            for key, value in self._table_key_values(soup):
+                if key and value and key != value:  # Avoid header rows
+                    # Clean and normalize the key
+                    clean_key = self._clean_specification_key(key)
+                    specs[clean_key] = value
         
         except Exception as e:
             self.logger.error(f"Error extracting table specifications: {str(e)}")
         
         return specs
     
-    def _extract_legacy_specifications(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract specifications using regex patterns (legacy method)."""
+    def _extract_legacy_specifications(self, soup: BeautifulSoup, raw_text: Optional[str] = None,
+                                       page_text: Optional[str] = None) -> Dict[str, str]:
+        """
+        Extract specifications using regex patterns (legacy method).
+        
+        Args:
+            soup: BeautifulSoup object of the page
+            raw_text: soup.get_text(), if the caller already has it
+            page_text: Lowercased raw_text, if the caller already has it
+        
+        Returns:
+            Dictionary of legacy specification values
+        """
         specs = {}
         
         try:
-            page_text = soup.get_text().lower()
+            if raw_text is None:
+                raw_text = soup.get_text()
+            if page_text is None:
+                page_text = raw_text.lower()
             
-            # Power-focused specification patterns for SoC power prediction modeling
-            spec_patterns = {
-                # Core specifications (critical for power modeling)
-                'total_cores': r'total cores\s*(\d+)',
-                'performance_cores': r'(?:# of )?performance[- ]cores?\s*(\d+)',
-                'efficiency_cores': r'(?:# of )?(?:low power )?efficient?[- ]cores?\s*(\d+)',
-                'total_threads': r'total threads\s*(\d+)',
-                
-                # Frequencies (critical for power prediction)
-                'max_turbo_frequency': r'max turbo frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'base_frequency': r'(?:processor )?base frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'performance_core_max_frequency': r'performance[- ]core max turbo frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'efficiency_core_max_frequency': r'(?:low power )?efficient?[- ]core max turbo frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'performance_core_base_frequency': r'performance[- ]core base frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'efficiency_core_base_frequency': r'(?:low power )?efficient?[- ]core base frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'turbo_boost_max_frequency': r'intel.*?turbo boost max.*?frequency.*?(\d+(?:\.\d+)?)\s*ghz',
-                
-                # Power specifications (most critical for power modeling)
-                'processor_base_power': r'processor base power\s*(\d+(?:\.\d+)?)\s*w',
-                'maximum_turbo_power': r'maximum turbo power\s*(\d+(?:\.\d+)?)\s*w',
-                'minimum_assured_power': r'minimum assured power\s*(\d+(?:\.\d+)?)\s*w',
-                'tdp': r'tdp\s*(\d+(?:\.\d+)?)\s*w',
-                'configurable_tdp_up': r'configurable tdp[- ]up\s*(\d+(?:\.\d+)?)\s*w',
-                'configurable_tdp_down': r'configurable tdp[- ]down\s*(\d+(?:\.\d+)?)\s*w',
-                
-                # Cache (affects power consumption)
-                'cache_size': r'cache\s*(\d+(?:\.\d+)?)\s*mb',
-                'smart_cache': r'(?:intel )?smart cache\s*(\d+(?:\.\d+)?)\s*mb',
-                'l1_cache': r'l1 cache\s*(\d+(?:\.\d+)?)\s*(?:mb|kb)',
-                'l2_cache': r'l2 cache\s*(\d+(?:\.\d+)?)\s*(?:mb|kb)',
-                'l3_cache': r'l3 cache\s*(\d+(?:\.\d+)?)\s*mb',
-                
-                # Process technology (critical for power characteristics)
-                # Simplified: just look for "Lithography" or "CPU Lithography" label and parse paired value
-                'lithography': r'(?:cpu\s+)?lithography\s*[:\s]+([^\n\r<>]+?)(?=\s*(?:\n|\r|<|$))',
-                
-                # Memory (affects system power)
-                'max_memory_size': r'max memory.*?(\d+)\s*gb',
-                'memory_channels': r'max.*?memory channels\s*(\d+)',
-                'memory_types': r'memory types\s*([^\n\r]+(?:ddr|lpddr)[^\n\r]*)',
-                'memory_speed': r'(?:up to )?(\d+)\s*mt/s',
-                
-                # Graphics power specifications
-                'gpu_name': r'gpu name.*?([^\n\r]+(?:arc|uhd|iris|graphics)[^\n\r]*)',
-                'graphics_max_frequency': r'graphics.*?max.*?frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'graphics_base_frequency': r'graphics.*?base.*?frequency\s*(\d+(?:\.\d+)?)\s*ghz',
-                'xe_cores': r'xe[- ]cores\s*(\d+)',
-                'execution_units': r'execution units\s*(\d+)',
-                
-                # AI/NPU power specifications
-                'npu_name': r'npu name.*?([^\n\r]+ai boost[^\n\r]*)',
-                'npu_tops': r'npu.*?peak tops.*?(\d+)',
-                'overall_tops': r'overall peak tops.*?(\d+)',
-                'ai_boost': r'intel.*?ai boost.*?(\d+)',
-                
-                # Package and thermal (important for power modeling)
-                'socket': r'sockets? supported\s*([a-z0-9]+)',
-                'max_operating_temperature': r'max operating temperature\s*(\d+)\s*°?c',
-                'package_size': r'package size\s*([0-9.x]+mm)',
-                'tjunction': r't.*?junction\s*(\d+)\s*°?c',
-                
-                # Other relevant specs
-                'instruction_set': r'instruction set\s*([0-9]+-bit)',
-                'launch_date': r'launch date\s*([q\d\'\/\-\s]+)',
-                'code_name': r'code name.*?([^\n\r]+)',
-                'product_collection': r'product collection\s*([^\n\r]+)',
-                'vertical_segment': r'vertical segment\s*([^\n\r]+)',
-                
-                # Advanced power features (boolean patterns - return yes/no)
-                'speed_shift': r'(intel.*?speed shift)',
-                'turbo_boost': r'(intel.*?turbo boost)',
-                'enhanced_speedstep': r'(enhanced intel speedstep)',
-                'thermal_monitoring': r'(thermal monitoring)',
-                'configurable_tdp': r'(configurable tdp)',
-            }
+            # Enhanced lithography detection; the plain lithography pattern is
+            # only needed when it finds nothing
+            lithography_value = self._extract_lithography_enhanced(soup, raw_text)
+            if lithography_value:
+                self.logger.debug("Enhanced lithography detection found: %s", lithography_value)
             
-            for spec_name, pattern in spec_patterns.items():
-                match = re.search(pattern, page_text, re.IGNORECASE | re.MULTILINE)
+            # One Hyperscan pass narrows the patterns to try, when available
+            candidates = _legacy_candidates(page_text)
+            
+            for index, (spec_name, anchors, pattern) in enumerate(_LEGACY_SPEC_PATTERNS):
+                if spec_name == 'lithography' and lithography_value:
+                    specs[spec_name] = lithography_value
+                    continue
+                if candidates is not None and index not in candidates:
+                    continue
+                # Substring checks are far cheaper than a failing regex scan
+                if not all(anchor in page_text for anchor in anchors):
+                    continue
+                match = pattern.search(page_text)
                 if match:
                     value = match.group(1).strip()
                     if value:
                         specs[spec_name] = value
-            
-            # Enhanced lithography detection
-            lithography_value = self._extract_lithography_enhanced(soup, soup.get_text())
-            if lithography_value:
-                specs['lithography'] = lithography_value
-                self.logger.debug(f"Enhanced lithography detection found: {lithography_value}")
         
         except Exception as e:
             self.logger.error(f"Error extracting legacy specifications: {str(e)}")
@@ -826,8 +1534,7 @@ class IntelCpuParser:
             return ""
         
         # Remove special characters and normalize spacing
-        clean_key = re.sub(r'[^\w\s\-]', '', key)
-        clean_key = re.sub(r'\s+', ' ', clean_key).strip()
+        clean_key = ' '.join(key.translate(_KEY_CHAR_TABLE).split())
         
         # Convert to lowercase and replace spaces with underscores
         clean_key = clean_key.lower().replace(' ', '_').replace('-', '_')
@@ -847,55 +1554,32 @@ class IntelCpuParser:
         return clean_key
     
     def _normalize_specification_unicode(self, specs: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize Unicode characters in all specification values."""
+        """
+        Normalize Unicode characters in all specification values, in place.
+        
+        Specs are category -> {key: value} dicts; values are rewritten in
+        their existing dicts rather than rebuilding the tree. Deeper nesting
+        is handled by recursing into it.
+        """
         try:
-            def normalize_dict(d):
-                if isinstance(d, dict):
-                    return {k: normalize_dict(v) for k, v in d.items()}
-                elif isinstance(d, str):
-                    return normalize_unicode_text(d)
-                else:
-                    return d
+            for category, section in specs.items():
+                if isinstance(section, dict):
+                    for key, value in section.items():
+                        if isinstance(value, str):
+                            section[key] = normalize_unicode_text(value)
+                        elif isinstance(value, dict):
+                            self._normalize_specification_unicode(value)
+                elif isinstance(section, str):
+                    specs[category] = normalize_unicode_text(section)
             
-            return normalize_dict(specs)
+            return specs
         except Exception as e:
             self.logger.error(f"Error normalizing Unicode in specifications: {str(e)}")
             return specs
     
     def _categorize_specification(self, key: str) -> str:
         """Categorize a specification into appropriate section."""
-        key_lower = key.lower()
-        
-        # CPU related
-        if any(word in key_lower for word in ['core', 'thread', 'frequency', 'turbo', 'cache']):
-            return 'cpu_specifications'
-        
-        # Memory related
-        if any(word in key_lower for word in ['memory', 'ddr', 'lpddr', 'channel']):
-            return 'memory_specifications'
-        
-        # Graphics related
-        if any(word in key_lower for word in ['gpu', 'graphics', 'display', 'resolution', 'xe']):
-            return 'gpu_specifications'
-        
-        # AI/NPU related
-        if any(word in key_lower for word in ['npu', 'ai', 'tops', 'neural']):
-            return 'npu_specifications'
-        
-        # Power related
-        if any(word in key_lower for word in ['power', 'tdp', 'watt', 'temperature']):
-            return 'package_specifications'
-        
-        # Connectivity
-        if any(word in key_lower for word in ['pci', 'thunderbolt', 'usb', 'expansion']):
-            return 'expansion_options'
-        
-        # Security
-        if any(word in key_lower for word in ['security', 'encryption', 'trust', 'guard']):
-            return 'security_reliability'
-        
-        # Default category
-        return 'general'
+        return _categorize_key(key.lower())
     
     def _categorize_legacy_specifications(self, legacy_specs: Dict[str, str]) -> Dict[str, Dict[str, str]]:
         """Categorize legacy specifications into proper sections."""
@@ -912,54 +1596,10 @@ class IntelCpuParser:
             'supplemental_information': {}
         }
         
-        # Define categorization mappings
-        category_mappings = {
-            'essentials': [
-                'product_collection', 'vertical_segment', 'launch_date', 'code_name', 'instruction_set'
-            ],
-            'cpu_specifications': [
-                'total_cores', 'performance_cores', 'efficiency_cores', 'total_threads',
-                'max_turbo_frequency', 'base_frequency', 'performance_core_max_frequency',
-                'efficiency_core_max_frequency', 'performance_core_base_frequency',
-                'efficiency_core_base_frequency', 'turbo_boost_max_frequency',
-                'cache_size', 'smart_cache', 'l1_cache', 'l2_cache', 'l3_cache', 'lithography'
-            ],
-            'memory_specifications': [
-                'max_memory_size', 'memory_channels', 'memory_types', 'memory_speed'
-            ],
-            'gpu_specifications': [
-                'gpu_name', 'graphics_max_frequency', 'graphics_base_frequency',
-                'xe_cores', 'execution_units'
-            ],
-            'npu_specifications': [
-                'npu_name', 'npu_tops', 'overall_tops', 'ai_boost'
-            ],
-            'expansion_options': [
-                'socket'
-            ],
-            'package_specifications': [
-                'processor_base_power', 'maximum_turbo_power', 'minimum_assured_power',
-                'tdp', 'configurable_tdp_up', 'configurable_tdp_down',
-                'max_operating_temperature', 'package_size', 'tjunction'
-            ],
-            'advanced_technologies': [
-                'speed_shift', 'turbo_boost', 'enhanced_speedstep', 'thermal_monitoring',
-                'configurable_tdp'
-            ]
-        }
-        
-        # Categorize each specification
+        # Categorize each specification; unknown ones go to supplemental_information
         for spec_key, spec_value in legacy_specs.items():
-            categorized_spec = False
-            for category, spec_list in category_mappings.items():
-                if spec_key in spec_list:
-                    categorized[category][spec_key] = spec_value
-                    categorized_spec = True
-                    break
-            
-            # If not categorized, put in supplemental_information
-            if not categorized_spec:
-                categorized['supplemental_information'][spec_key] = spec_value
+            category = _SPEC_TO_CATEGORY.get(spec_key, 'supplemental_information')
+            categorized[category][spec_key] = spec_value
         
         # Remove empty categories
         return {k: v for k, v in categorized.items() if v}
@@ -973,22 +1613,9 @@ class IntelCpuParser:
             if current:
                 header_text = current.get_text().lower()
                 
-                if 'cpu' in header_text or 'processor' in header_text:
-                    return 'cpu_specifications'
-                elif 'memory' in header_text:
-                    return 'memory_specifications'
-                elif 'gpu' in header_text or 'graphics' in header_text:
-                    return 'gpu_specifications'
-                elif 'npu' in header_text or 'ai' in header_text:
-                    return 'npu_specifications'
-                elif 'expansion' in header_text or 'connectivity' in header_text:
-                    return 'expansion_options'
-                elif 'package' in header_text:
-                    return 'package_specifications'
-                elif 'security' in header_text:
-                    return 'security_reliability'
-                elif 'essential' in header_text:
-                    return 'essentials'
+                for keyword, section in _PARENT_SECTION_KEYWORDS:
+                    if keyword in header_text:
+                        return section
         
         except Exception:
             pass
@@ -998,22 +1625,16 @@ class IntelCpuParser:
     def _extract_lithography_enhanced(self, soup: BeautifulSoup, text: str) -> Optional[str]:
         """Simplified lithography detection - look for 'Lithography' or 'CPU Lithography' label and parse paired value."""
         try:
-            # Simple pattern: find "Lithography" or "CPU Lithography" label followed by the value
+            # Find "Lithography" or "CPU Lithography" label followed by the value
             # This matches the actual structure on Intel spec pages
-            lithography_patterns = [
-                r'(?:cpu\s+)?lithography\s*[:\s]+([^\n\r<>]+?)(?=\s*(?:\n|\r|<|$))',
-            ]
-            
-            # Search through patterns
-            for pattern in lithography_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
+            for pattern in _LITHO_LABEL_PATTERNS:
+                for match in pattern.finditer(text):
                     extracted = match.group(1).strip()
                     
                     # Clean and validate the extracted value
                     cleaned = self._clean_lithography_value(extracted)
                     if cleaned:
-                        self.logger.debug(f"Found lithography: {cleaned}")
+                        self.logger.debug("Found lithography: %s", cleaned)
                         return cleaned
             
             # Fallback: Look for standalone technology values in structured data
@@ -1032,116 +1653,57 @@ class IntelCpuParser:
             return None
         
         # Remove common prefixes/suffixes and clean
-        value = re.sub(r'^(?:using|with|on|at|by)\s+', '', value, flags=re.IGNORECASE)
-        value = re.sub(r'\s+(?:process|technology|node|class|generation|finfet|gaafet)$', '', value, flags=re.IGNORECASE)
+        value = _LITHO_PREFIX_RX.sub('', value)
+        value = _LITHO_SUFFIX_RX.sub('', value)
         value = value.strip()
         
         # Additional cleaning for better readability
-        value = re.sub(r'\s+', ' ', value)  # Normalize spaces
-        value = re.sub(r'[\(\)\[\]]', '', value)  # Remove brackets
+        value = _WS_RX.sub(' ', value)  # Normalize spaces
+        value = _BRACKETS_RX.sub('', value)  # Remove brackets
         
         # Exclude known non-process Intel technologies
-        non_process_intel_terms = [
-            'intel 64',     # 64-bit instruction set
-            'intel 32',     # 32-bit instruction set
-            'intel x86',    # x86 architecture
-            'intel x64',    # x64 architecture
-            'intel sse',    # SIMD instruction sets
-            'intel avx',    # Advanced Vector Extensions
-            'intel ht',     # Hyper-Threading
-            'intel vt',     # Virtualization Technology
-        ]
-        
-        for term in non_process_intel_terms:
-            if value.lower() == term:
-                return None
+        if value.lower() in _NON_PROCESS_INTEL_TERMS:
+            return None
         
         # Validate that it contains meaningful lithography information
         # More permissive validation since we're now getting values directly paired with "Lithography" label
-        valid_patterns = [
-            r'\d+\s*nm',                    # 14 nm, 10nm, etc.
-            r'intel\s+(?:[3-9]|1[0-9])\b', # Intel 3, Intel 7, Intel 10, etc. (not 32/64)
-            r'n\d+[a-z]?\b',                # N5, N3, N3B (TSMC naming)
-            r'\d+\s*nanometer',            # 7 nanometer
-            r'\d+\s*nm\s*\+',              # 14nm+, enhanced processes
-            r'intel\s+(?:[3-9]|1[0-9])\s*\+', # Intel 7+
-            r'\d+\s*nm\s+(?:finfet|gaafet)', # Advanced transistor types
-            r'tsmc\s+n\d+',                # TSMC N5, N3, etc.
-            r'samsung\s+\d+\s*nm',         # Samsung processes
-            r'globalfoundries\s+\d+\s*nm', # GF processes
-        ]
-        
-        for pattern in valid_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                return value
-        
-        return None
+        return value if _LITHO_VALID_RX.search(value) else None
     
     def _extract_lithography_fallback(self, soup: BeautifulSoup) -> Optional[str]:
         """Fallback method to find lithography in structured elements."""
         try:
             # Look in specification tables specifically
-            tables = soup.find_all('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        key = cells[0].get_text(strip=True).lower()
-                        value = cells[1].get_text(strip=True)
-                        
-                        # Check if key indicates lithography
-                        lithography_keywords = [
-                            'lithography', 'process', 'technology', 'node', 
-                            'fabrication', 'manufacturing', 'silicon'
-                        ]
-                        
-                        if any(keyword in key for keyword in lithography_keywords):
-                            cleaned = self._clean_lithography_value(value)
-                            if cleaned:
-                                return cleaned
+            for key, value in self._table_key_values(soup):
+                key = key.lower()
+                
+                # Check if key indicates lithography
+                if any(keyword in key for keyword in _TABLE_LITHO_KEYWORDS):
+                    cleaned = self._clean_lithography_value(value)
+                    if cleaned:
+                        return cleaned
             
             # Look in definition lists
-            dls = soup.find_all('dl')
+            dls = self._find_all_cached(soup, 'dl')
             for dl in dls:
-                dt_elements = dl.find_all('dt')
-                dd_elements = dl.find_all('dd')
-                
-                for i, dt in enumerate(dt_elements):
-                    if i < len(dd_elements):
-                        key = dt.get_text(strip=True).lower()
-                        value = dd_elements[i].get_text(strip=True)
-                        
-                        lithography_keywords = [
-                            'lithography', 'process', 'technology', 'node', 
-                            'fabrication', 'manufacturing'
-                        ]
-                        
-                        if any(keyword in key for keyword in lithography_keywords):
-                            cleaned = self._clean_lithography_value(value)
-                            if cleaned:
-                                return cleaned
+                for key, value in self._dl_pair_texts(dl):
+                    key = key.lower()
+                    
+                    if any(keyword in key for keyword in _DL_LITHO_KEYWORDS):
+                        cleaned = self._clean_lithography_value(value)
+                        if cleaned:
+                            return cleaned
                                 
         except Exception as e:
-            self.logger.debug(f"Error in lithography fallback extraction: {str(e)}")
+            self.logger.debug("Error in lithography fallback extraction: %s", e)
         
         return None
     
     def _extract_price(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract CPU price from the page."""
-        price_selectors = [
-            '.price',
-            '.product-price',
-            '[data-testid="price"]',
-            '.pdp-price'
-        ]
-        
-        for selector in price_selectors:
-            element = soup.select_one(selector)
-            if element:
-                price_text = element.get_text(strip=True)
+        for price_text in self._select_first_texts(soup, _PRICE_SELECTORS):
+            if price_text is not None:
                 # Look for price pattern
-                price_match = re.search(r'\$[\d,]+(?:\.\d{2})?', price_text)
+                price_match = _RE_PRICE.search(price_text)
                 if price_match:
                     return price_match.group()
         
@@ -1149,33 +1711,48 @@ class IntelCpuParser:
     
     def _extract_availability(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract availability information."""
-        availability_selectors = [
-            '.availability',
-            '.stock-status',
-            '[data-testid="availability"]'
-        ]
-        
-        for selector in availability_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text(strip=True)
+        for availability in self._select_first_texts(soup, _AVAILABILITY_SELECTORS):
+            if availability is not None:
+                return availability
         
         return None
     
     def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract product description."""
-        desc_selectors = [
-            '.product-description',
-            '.pdp-description',
-            '[data-testid="description"]',
-            '.product-overview'
-        ]
-        
-        for selector in desc_selectors:
-            element = soup.select_one(selector)
-            if element:
-                description = element.get_text(strip=True)
+        for description in self._select_first_texts(soup, _DESCRIPTION_SELECTORS):
+            if description is not None:
                 if len(description) > 10:  # Basic validation
                     return description[:500]  # Limit length
         
-        return None
\ No newline at end of file
+        return None
+
+
+# Parser instance owned by a parse worker process
+_WORKER_PARSER: Optional[IntelCpuParser] = None
+
+
+def init_parser_worker():
+    """Create the per-process parser; used as a ProcessPoolExecutor initializer."""
+    global _WORKER_PARSER
+    _WORKER_PARSER = IntelCpuParser()
+
+
+def parse_page_bytes(html: bytes, url: str, encoding: Optional[str] = None,
+                     scraped_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Parse a CPU page from raw bytes, for use in parse worker processes.
+    
+    Only bytes and plain dicts cross the process boundary; the soup is
+    built and discarded inside the worker.
+    
+    Args:
+        html: Raw page bytes
+        url: URL of the page
+        encoding: Page encoding declared by the server, if any
+        scraped_at: ISO timestamp shared by a crawl batch
+    
+    Returns:
+        Dictionary containing CPU specifications
+    """
+    parser = _WORKER_PARSER if _WORKER_PARSER is not None else IntelCpuParser()
+    return parser.parse_cpu_page(html, url, encoding, scraped_at)
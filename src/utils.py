@@ -3,30 +3,121 @@ Utility functions for Intel CPU Crawler
 Common helper functions and utilities.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import os
+import queue
+import re
+import threading
+import time
 import colorlog
 import requests
-from typing import Dict, Any
+from datetime import datetime
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+_CLEAN_WS_RX = re.compile(r'\s+')
+
+# Content codings urllib3 can decode here; br and zstd are only listed
+# when brotli / zstandard are installed
+_ACCEPT_ENCODING = ', '.join(ACCEPT_ENCODING.split(','))
+
+# Default request headers, shared read-only by every get_headers() caller
+_BASE_HEADERS = MappingProxyType({
+    'User-Agent': 'Intel CPU Crawler 1.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+})
+
+# Background listener writing queued log records; replaced on each setup_logging
+_LOG_LISTENER = None
+
+# http(s) URL with a non-empty host and no whitespace
+_URL_RE = re.compile(r'https?://[^\s/$.?#]\S*', re.IGNORECASE)
+
+# Shared sessions keyed by (user_agent, pool size)
+_SESSIONS: Dict[Tuple[str, int], requests.Session] = {}
+
+
+class WordCharTable(dict):
+    """
+    str.translate table keeping word characters, whitespace and extra characters.
+    
+    Translating with it matches re.sub over the negated word/whitespace/extra
+    character class. Entries are filled on first lookup, so the table only
+    holds characters actually seen.
+    """
+    
+    def __init__(self, extra_chars: str = ''):
+        """
+        Initialize the table.
+        
+        Args:
+            extra_chars: Characters to keep besides word characters and whitespace
+        """
+        super().__init__()
+        self.extra_chars = extra_chars
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = char.isalnum() or char == '_' or char.isspace() or char in self.extra_chars
+        result = codepoint if keep else None
+        self[codepoint] = result
+        return result
+
+
+# Characters clean_text keeps besides word characters and whitespace
+_CLEAN_TEXT_TABLE = WordCharTable('-.,;:()&+/')
+
+# The same filter for ASCII input, as a bytes.translate deletion set
+_CLEAN_TEXT_ASCII_DELETE = bytes(c for c in range(128) if _CLEAN_TEXT_TABLE[c] is None)
 
 
 def setup_logging(level: str = 'INFO') -> logging.Logger:
     """
     Set up colored logging for the application.
     
+    Records are queued by the root logger and written to the console and
+    log file on a background listener thread, keeping disk I/O off the
+    crawl and parse path. File records are buffered and written in
+    batches, or immediately for errors.
+    
+    Handlers are built once until stop_logging() is called; later calls only
+    update the level.
+    
     Args:
         level: Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR')
         
     Returns:
         Configured logger instance
     """
-    # Create logs directory if it doesn't exist
-    import os
-    os.makedirs('logs', exist_ok=True)
+    global _LOG_LISTENER
     
     # Configure root logger
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, level.upper()))
     
+    # Already configured: keep the running listener and its handlers
+    if _listener_running():
+        return logger
+    
+    # A listener stopped behind our back is torn down and rebuilt
+    stop_logging()
+    
+    # Create logs directory if it doesn't exist
+    os.makedirs('logs', exist_ok=True)
+    
     # Remove existing handlers to avoid duplicates
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
@@ -45,49 +136,225 @@ def setup_logging(level: str = 'INFO') -> logging.Logger:
         }
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
     
     # File handler
-    from datetime import datetime
     log_filename = f"logs/crawler_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    rotating_handler = logging.handlers.RotatingFileHandler(
+        log_filename, maxBytes=32 * 1024 * 1024, backupCount=5,
+        encoding='utf-8', delay=True
+    )
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    rotating_handler.setFormatter(file_formatter)
+    
+    # Buffer file records so the disk sees batched writes; errors flush at once
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR,
+        target=rotating_handler, flushOnClose=True
+    )
+    
+    # Callers only enqueue; the listener thread does the console and file writes
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _LOG_LISTENER = logging.handlers.QueueListener(log_queue, console_handler, file_handler,
+                                                   respect_handler_level=True)
+    _LOG_LISTENER.start()
     
     return logger
 
 
-def get_headers(user_agent: str = None) -> Dict[str, str]:
+def _listener_running() -> bool:
+    """Check whether setup_logging's listener thread is alive."""
+    return _LOG_LISTENER is not None and getattr(_LOG_LISTENER, '_thread', None) is not None
+
+
+@atexit.register
+def stop_logging():
+    """
+    Stop the log listener, flushing queued and buffered records to their handlers.
+    
+    Safe to call more than once; setup_logging builds a fresh listener afterwards.
+    """
+    global _LOG_LISTENER
+    if _LOG_LISTENER is None:
+        return
+    
+    # Detach the queue first so nothing piles up behind a stopped listener
+    logger = logging.getLogger()
+    for handler in logger.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is _LOG_LISTENER.queue:
+            logger.removeHandler(handler)
+    
+    if _listener_running():
+        _LOG_LISTENER.stop()
+    for handler in _LOG_LISTENER.handlers:
+        handler.close()
+        # MemoryHandler.close flushes its buffer but leaves the file open
+        target = getattr(handler, 'target', None)
+        if target is not None:
+            target.close()
+    _LOG_LISTENER = None
+
+
+@functools.lru_cache(maxsize=8)
+def get_headers(user_agent: str = None) -> Mapping[str, str]:
     """
     Get HTTP headers for requests.
     
+    Results are cached per user agent and returned as read-only mappings,
+    so repeated calls share one object.
+    
     Args:
         user_agent: Custom user agent string
         
     Returns:
-        Dictionary of HTTP headers
+        Mapping of HTTP headers
+    """
+    if user_agent is None or user_agent == _BASE_HEADERS['User-Agent']:
+        return _BASE_HEADERS
+    
+    headers = dict(_BASE_HEADERS)
+    headers['User-Agent'] = user_agent
+    return MappingProxyType(headers)
+
+
+def get_session(user_agent: str = None, pool: int = 32) -> requests.Session:
     """
-    if user_agent is None:
-        user_agent = 'Intel CPU Crawler 1.0'
+    Get a shared HTTP session with connection pooling and keep-alive.
     
-    headers = {
-        'User-Agent': user_agent,
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Cache-Control': 'max-age=0'
-    }
+    Sessions are cached per user agent and pool size, so repeated calls
+    reuse open connections instead of paying a new TCP/TLS handshake.
+    Retries are left to the caller.
     
-    return headers
+    Args:
+        user_agent: Custom user agent string
+        pool: Number of pooled connections per host
+        
+    Returns:
+        Configured requests session
+    """
+    headers = get_headers(user_agent)
+    key = (headers['User-Agent'], pool)
+    
+    session = _SESSIONS.get(key)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(headers)
+        _SESSIONS[key] = session
+    
+    return session
+
+
+@atexit.register
+def _close_sessions():
+    """Close pooled connections of the shared sessions at interpreter exit."""
+    for session in _SESSIONS.values():
+        session.close()
+    _SESSIONS.clear()
+
+
+class RateLimiter:
+    """
+    Thread-safe fixed-interval rate limiter that backs off when throttled.
+    
+    acquire() spaces calls at least `interval` seconds apart. backoff()
+    doubles the interval (and honours Retry-After) after a 429/503;
+    record_success() halves it back towards the configured interval after
+    a run of successful requests. It never goes faster than configured.
+    """
+    
+    # Interval used when backing off from a zero configured delay
+    MIN_BACKOFF_INTERVAL = 1.0
+    
+    def __init__(self, interval: float, max_interval: float = 60.0,
+                 recover_after: int = 100):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            interval: Configured minimum seconds between acquisitions
+            max_interval: Upper bound for the backed-off interval
+            recover_after: Consecutive successes before speeding back up
+        """
+        self.base_interval = max(0.0, interval)
+        self.interval = self.base_interval
+        self.max_interval = max(max_interval, self.base_interval)
+        self.recover_after = recover_after
+        self._next_at = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the next request may start."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_at:
+                time.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self.interval
+    
+    def record_success(self):
+        """Count a successful request, relaxing a backed-off interval after enough of them."""
+        with self._lock:
+            if self.interval <= self.base_interval:
+                return
+            self._successes += 1
+            if self._successes >= self.recover_after:
+                halved = self.interval / 2
+                floor = max(self.base_interval, self.MIN_BACKOFF_INTERVAL)
+                self.interval = halved if halved >= floor else self.base_interval
+                self._successes = 0
+    
+    def backoff(self, retry_after: Optional[float] = None):
+        """
+        Slow down after the server signalled throttling.
+        
+        Args:
+            retry_after: Seconds from a Retry-After header, if any
+        """
+        with self._lock:
+            self._successes = 0
+            self.interval = min(self.max_interval,
+                                max(self.interval * 2, self.MIN_BACKOFF_INTERVAL))
+            if retry_after:
+                self._next_at = max(self._next_at, time.monotonic() + retry_after)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+    
+    Args:
+        value: Header value
+    
+    Returns:
+        Delay in seconds, or None if missing or not a number of seconds
+    """
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def _http_error_message(error: Exception, url: str) -> str:
+    status_code = getattr(error.response, 'status_code', 'Unknown')
+    return f"HTTP error {status_code} for URL: {url}"
+
+
+# Log message builders for request errors, looked up along the exception's MRO
+_REQUEST_ERROR_MESSAGES = {
+    # ConnectTimeout subclasses ConnectionError before Timeout, so list it explicitly
+    requests.exceptions.ConnectTimeout: lambda error, url: f"Request timeout for URL: {url}",
+    requests.exceptions.Timeout: lambda error, url: f"Request timeout for URL: {url}",
+    requests.exceptions.ConnectionError: lambda error, url: f"Connection error for URL: {url}",
+    requests.exceptions.HTTPError: _http_error_message,
+    requests.exceptions.RequestException: lambda error, url: f"Request error for URL {url}: {str(error)}",
+}
 
 
 def handle_request_error(error: Exception, url: str, logger: logging.Logger):
@@ -99,17 +366,13 @@ def handle_request_error(error: Exception, url: str, logger: logging.Logger):
         url: URL that caused the error
         logger: Logger instance
     """
-    if isinstance(error, requests.exceptions.Timeout):
-        logger.error(f"Request timeout for URL: {url}")
-    elif isinstance(error, requests.exceptions.ConnectionError):
-        logger.error(f"Connection error for URL: {url}")
-    elif isinstance(error, requests.exceptions.HTTPError):
-        status_code = getattr(error.response, 'status_code', 'Unknown')
-        logger.error(f"HTTP error {status_code} for URL: {url}")
-    elif isinstance(error, requests.exceptions.RequestException):
-        logger.error(f"Request error for URL {url}: {str(error)}")
-    else:
-        logger.error(f"Unexpected error for URL {url}: {str(error)}")
+    for error_class in type(error).__mro__:
+        build_message = _REQUEST_ERROR_MESSAGES.get(error_class)
+        if build_message is not None:
+            logger.error(build_message(error, url))
+            return
+    
+    logger.error(f"Unexpected error for URL {url}: {str(error)}")
 
 
 def validate_url(url: str) -> bool:
@@ -122,13 +385,7 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL is valid, False otherwise
     """
-    from urllib.parse import urlparse
-    
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    return isinstance(url, str) and _URL_RE.fullmatch(url) is not None
 
 
 def clean_text(text: str) -> str:
@@ -144,13 +401,15 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    import re
-    
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = ' '.join(text.split())
     
-    # Remove special characters that might cause issues
-    text = re.sub(r'[^\w\s\-\.,;:()&+/]', '', text)
+    # Remove special characters that might cause issues; plain ASCII text
+    # takes the cheaper bytes-level deletion
+    if text.isascii():
+        text = text.encode('ascii').translate(None, _CLEAN_TEXT_ASCII_DELETE).decode('ascii')
+    else:
+        text = text.translate(_CLEAN_TEXT_TABLE)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -158,6 +417,12 @@ def clean_text(text: str) -> str:
     return text
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_number_pattern(pattern: str) -> re.Pattern:
+    """Compile a safe_extract_number pattern once per distinct pattern string."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def safe_extract_number(text: str, pattern: str) -> str:
     """
     Safely extract numeric values from text using regex.
@@ -169,13 +434,11 @@ def safe_extract_number(text: str, pattern: str) -> str:
     Returns:
         Extracted number as string, or empty string if not found
     """
-    import re
-    
     if not text:
         return ""
     
     try:
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _compile_number_pattern(pattern).search(text)
         return match.group(1) if match else ""
     except Exception:
         return ""
@@ -200,8 +463,6 @@ def normalize_unicode_text(text: str) -> str:
         return text
     
     try:
-        import re
-        
         # Handle malformed UTF-8 encoding issues common in web scraping
         # Intel pages often have double-encoded UTF-8 for trademark symbols
         
@@ -237,7 +498,7 @@ def normalize_unicode_text(text: str) -> str:
             normalized = normalized.replace(old, new)
         
         # Clean up whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = _CLEAN_WS_RX.sub(' ', normalized).strip()
         
         return normalized
         
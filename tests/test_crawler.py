@@ -42,6 +42,54 @@ class TestIntelCpuParser(unittest.TestCase):
         for url in non_cpu_urls:
             with self.subTest(url=url):
                 self.assertFalse(self.parser._is_cpu_url(url))
+    
+    def test_bytes_input_matches_full_soup(self):
+        """Test that parsing raw page bytes matches parsing a full soup."""
+        from bs4 import BeautifulSoup
+        from parser import PARSER
+        html = (
+            '<html><head><title>Intel\u00ae Core\u2122 i5-1335U Processor</title></head><body>'
+            '<h1>Intel\u00ae Core\u2122 i5-1335U Processor</h1>'
+            '<section class="specs"><h2>Essentials</h2><ul>'
+            '<li><span class="label">Code Name</span> <span class="value">Products formerly Raptor Lake</span></li>'
+            '<li><span class="label">Lithography</span> <span class="value">Intel 7</span></li>'
+            '</ul></section>'
+            '<section><h2>CPU Specifications</h2><ul>'
+            '<li><span>Total Cores</span> <span>10</span></li>'
+            '<li><span>Max Turbo Frequency</span> <span>4.60 GHz</span></li>'
+            '<li><span>Processor Base Power</span> <span>15 W</span></li>'
+            '</ul></section>'
+            '<section><h2>Memory Specifications</h2>'
+            '<p>Max Memory Size <span>64</span> <span>GB</span></p>'
+            '<p>Sockets Supported <span>FCBGA1700</span></p>'
+            '</section></body></html>'
+        ).encode('utf-8')
+        url = 'https://www.intel.com/content/www/us/en/products/sku/232143/x/specifications.html'
+        
+        from_bytes = self.parser.parse_cpu_page(html, url, 'utf-8')
+        from_soup = self.parser.parse_cpu_page(
+            BeautifulSoup(html, PARSER, from_encoding='utf-8'), url)
+        from_bytes.pop('scraped_at')
+        from_soup.pop('scraped_at')
+        
+        self.assertEqual(from_bytes, from_soup)
+    
+    def test_bytes_listing_keeps_container_links(self):
+        """Test that links found only through their container survive bytes input."""
+        html = (
+            b'<html><body>'
+            b'<div class="product-card"><a href="/content/www/us/en/ark/sku/12345/core-i5.html">Compare</a></div>'
+            b'<TABLE><tr><td><a href="/content/www/us/en/ark/sku/67890/xeon-specifications.htm">Compare</a></td></tr></TABLE>'
+            b'</body></html>'
+        )
+        base_url = 'https://www.intel.com/content/www/us/en/products/processors.html'
+        
+        urls = self.parser.extract_cpu_urls(html, base_url, 'utf-8')
+        
+        self.assertEqual(urls, [
+            'https://www.intel.com/content/www/us/en/ark/sku/12345/core-i5.html',
+            'https://www.intel.com/content/www/us/en/ark/sku/67890/xeon-specifications.htm',
+        ])
 
 
 class TestDataManager(unittest.TestCase):
@@ -52,13 +100,13 @@ class TestDataManager(unittest.TestCase):
         from data_manager import DataManager
         import tempfile
         
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self._tmp = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self._tmp.name)
         self.data_manager = DataManager(self.temp_dir)
     
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self._tmp.cleanup()
     
     def test_flatten_data(self):
         """Test data flattening for CSV export."""
@@ -133,7 +181,43 @@ class TestUtils(unittest.TestCase):
             with self.subTest(input_text=input_text):
                 result = clean_text(input_text)
                 self.assertEqual(result, expected)
+    
+    def test_rate_limiter_backoff(self):
+        """Test rate limiter backs off when throttled and recovers to the configured delay."""
+        from utils import RateLimiter
+        
+        limiter = RateLimiter(2.0, max_interval=10.0, recover_after=2)
+        
+        limiter.backoff()
+        limiter.backoff()
+        limiter.backoff()
+        self.assertEqual(limiter.interval, 10.0)  # Capped at max_interval
+        
+        for _ in range(6):
+            limiter.record_success()
+        self.assertEqual(limiter.interval, 2.0)  # Never faster than configured
 
+    
+    def test_logging_restarts_after_stop(self):
+        """Test setup_logging rebuilds a stopped listener and stop_logging is idempotent."""
+        import logging
+        import utils
+        self.addCleanup(utils.stop_logging)
+        
+        logger = utils.setup_logging('INFO')
+        utils._LOG_LISTENER.stop()  # Stopped outside stop_logging
+        
+        logger = utils.setup_logging('INFO')
+        self.assertTrue(utils._listener_running())
+        self.assertEqual(len(logger.handlers), 1)
+        
+        utils.stop_logging()
+        utils.stop_logging()  # Already stopped: no error
+        self.assertIsNone(utils._LOG_LISTENER)
+        self.assertFalse(any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers))
+        
+        utils.setup_logging('INFO')
+        self.assertTrue(utils._listener_running())
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
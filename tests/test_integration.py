@@ -6,6 +6,8 @@ These tests cover the complete workflow from configuration loading to data expor
 """
 
 import unittest
+import functools
+import importlib
 import sys
 import os
 import tempfile
@@ -17,52 +19,75 @@ import sqlite3
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
+import main
+from crawler import IntelCpuCrawler
+from parser import IntelCpuParser
+from database_manager import PowerSpecDatabaseManager
+from data_manager import DataManager
+from utils import setup_logging, get_headers, validate_url, clean_text
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> dict:
+    """Parse config/config.yaml once per test run."""
+    import yaml
+    
+    config_path = Path(__file__).parent.parent / 'config' / 'config.yaml'
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
 
 class TestCrawlerIntegration(unittest.TestCase):
     """Integration tests for the complete crawler system."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up one temporary directory shared by the tests in this class."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._tmp.name
+        cls.test_db_path = os.path.join(cls.temp_dir, 'test_crawler.db')
+        cls.test_json_path = os.path.join(cls.temp_dir, 'test_output.json')
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls._tmp.cleanup()
+    
     def setUp(self):
-        """Set up test fixtures with temporary files."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_db_path = os.path.join(self.temp_dir, 'test_crawler.db')
-        self.test_json_path = os.path.join(self.temp_dir, 'test_output.json')
-        
-    def tearDown(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """Start each test with a fresh database file."""
+        for suffix in ('', '-wal', '-shm'):
+            Path(self.test_db_path + suffix).unlink(missing_ok=True)
     
     def test_module_imports(self):
         """Test that all core modules can be imported successfully."""
         # Test crawler module
-        from crawler import IntelCpuCrawler
-        self.assertTrue(hasattr(IntelCpuCrawler, 'crawl'))
+        crawler = importlib.import_module('crawler')
+        self.assertTrue(hasattr(crawler.IntelCpuCrawler, 'crawl'))
         
         # Test parser module
-        from parser import IntelCpuParser
-        self.assertTrue(hasattr(IntelCpuParser, 'parse_cpu_page'))
+        parser = importlib.import_module('parser')
+        self.assertTrue(hasattr(parser.IntelCpuParser, 'parse_cpu_page'))
         
         # Test database manager
-        from database_manager import PowerSpecDatabaseManager
-        self.assertTrue(hasattr(PowerSpecDatabaseManager, 'insert_cpu_specs'))
+        database_manager = importlib.import_module('database_manager')
+        self.assertTrue(hasattr(database_manager.PowerSpecDatabaseManager, 'insert_cpu_specs'))
         
         # Test data manager
-        from data_manager import DataManager
-        self.assertTrue(hasattr(DataManager, 'save_json'))
+        data_manager = importlib.import_module('data_manager')
+        self.assertTrue(hasattr(data_manager.DataManager, 'save_json'))
         
         # Test utilities
-        from utils import setup_logging, get_headers, validate_url, clean_text
-        self.assertTrue(callable(setup_logging))
-        self.assertTrue(callable(get_headers))
-        self.assertTrue(callable(validate_url))
-        self.assertTrue(callable(clean_text))
+        utils = importlib.import_module('utils')
+        self.assertTrue(callable(utils.setup_logging))
+        self.assertTrue(callable(utils.get_headers))
+        self.assertTrue(callable(utils.validate_url))
+        self.assertTrue(callable(utils.clean_text))
     
     def test_configuration_loading(self):
         """Test that configuration loading works correctly."""
-        from crawler import IntelCpuCrawler
-        
         # Test with default config
         crawler = IntelCpuCrawler(config_path='config/config.yaml')
+        self.addCleanup(crawler.close)
         self.assertIn('base_urls', crawler.config)
         self.assertIn('user_agent', crawler.config)
         self.assertIsInstance(crawler.config['base_urls'], list)
@@ -70,15 +95,15 @@ class TestCrawlerIntegration(unittest.TestCase):
         
         # Test with missing config (should use defaults)
         crawler_default = IntelCpuCrawler(config_path='nonexistent.yaml')
+        self.addCleanup(crawler_default.close)
         self.assertIn('base_urls', crawler_default.config)
         self.assertIn('user_agent', crawler_default.config)
     
     def test_database_operations(self):
         """Test complete database functionality."""
-        from database_manager import PowerSpecDatabaseManager
-        
         # Initialize database
         db_manager = PowerSpecDatabaseManager(self.test_db_path)
+        self.addCleanup(db_manager.close)
         
         # Test initial state
         self.assertEqual(db_manager.get_cpu_count(), 0)
@@ -118,11 +143,116 @@ class TestCrawlerIntegration(unittest.TestCase):
         stats = db_manager.get_power_statistics()
         self.assertIn('power', stats)
         self.assertEqual(stats['power']['total_cpus_with_power_data'], 1)
+        self.assertEqual(stats['power']['avg_base_power_w'], 65.0)
+        self.assertEqual(stats['core_distribution'], {'8_cores': 1})
+        self.assertEqual(stats['process_technology'], {'intel 7': 1})
+        
+        # Bulk inserts report CPUs added, not the summary rows the triggers write
+        bulk_cpus = [
+            {
+                'name': f'Bulk Test CPU {i}',
+                'url': f'https://example.com/bulk-test-cpu-{i}',
+                'specifications': {
+                    'legacy': {
+                        'total_cores': '8',
+                        'processor_base_power': '65.0',
+                        'maximum_turbo_power': '125.0',
+                        'lithography': 'intel 7'
+                    }
+                }
+            }
+            for i in range(3)
+        ]
+        inserted = db_manager.insert_cpu_specs_bulk(bulk_cpus + [sample_cpu_data])
+        self.assertEqual(inserted, 3)
+        self.assertEqual(db_manager.get_cpu_count(), 4)
+        
+        stats = db_manager.get_power_statistics()
+        self.assertEqual(stats['power']['total_cpus_with_power_data'], 4)
+        self.assertEqual(stats['core_distribution'], {'8_cores': 4})
+        self.assertEqual(stats['process_technology'], {'intel 7': 4})
+
+    def test_bulk_insert(self):
+        """Test batched inserts skip duplicates and report the inserted count."""
+        db_manager = PowerSpecDatabaseManager(self.test_db_path)
+        self.addCleanup(db_manager.close)
+        
+        cpus = [
+            {
+                'name': f'Bulk CPU {i}',
+                'url': f'https://example.com/bulk-cpu-{i}',
+                'specifications': {
+                    'legacy': {
+                        'total_cores': str(4 * i),
+                        'processor_base_power': '35.0'
+                    }
+                }
+            }
+            for i in range(1, 4)
+        ]
+        
+        # Duplicate URL inside the batch is ignored
+        self.assertEqual(db_manager.insert_cpu_specs_bulk(cpus + [cpus[0]]), 3)
+        self.assertEqual(db_manager.get_cpu_count(), 3)
+        
+        # Re-inserting the same batch adds nothing
+        self.assertEqual(db_manager.insert_cpu_specs_bulk(cpus), 0)
+        self.assertEqual(db_manager.get_cpu_count(), 3)
+        
+        # Rows match what the single-row path would store
+        search_results = db_manager.get_cpu_by_name('Bulk CPU 2')
+        self.assertEqual(len(search_results), 1)
+        self.assertEqual(search_results[0]['total_cores'], 8)
+        self.assertEqual(search_results[0]['processor_base_power'], 35.0)
+        
+        stats = db_manager.get_power_statistics()
+        self.assertEqual(stats['power']['total_cpus_with_power_data'], 3)
+    
+    def test_bulk_insert_skips_malformed_row(self):
+        """Test one malformed CPU in a batch does not lose the others."""
+        db_manager = PowerSpecDatabaseManager(self.test_db_path)
+        self.addCleanup(db_manager.close)
+        
+        good = [
+            {'name': f'Good CPU {i}', 'url': f'https://example.com/good-cpu-{i}', 'specifications': {}}
+            for i in range(1, 3)
+        ]
+        bad = {'name': 'Bad CPU', 'url': 'https://example.com/bad-cpu', 'specifications': ['not', 'a', 'dict']}
+        
+        self.assertEqual(db_manager.insert_cpu_specs_bulk([good[0], bad, good[1]]), 2)
+        self.assertEqual(db_manager.get_cpu_count(), 2)
+        self.assertEqual(db_manager.get_cpu_by_name('Bad CPU'), [])
+    
+    def test_writes_and_reads_after_bulk_insert(self):
+        """Test the manager keeps working through its own connections after a bulk insert."""
+        db_manager = PowerSpecDatabaseManager(self.test_db_path)
+        self.addCleanup(db_manager.close)
+        
+        def make_cpu(i):
+            return {
+                'name': f'Mixed CPU {i}',
+                'url': f'https://example.com/mixed-cpu-{i}',
+                'specifications': {'legacy': {'total_cores': '4', 'processor_base_power': '15.0'}}
+            }
+        
+        self.assertEqual(db_manager.insert_cpu_specs_bulk([make_cpu(i) for i in range(3)]), 3)
+        
+        # Single-row writes after the batch, including a duplicate
+        self.assertFalse(db_manager.insert_cpu_specs(make_cpu(2)))
+        self.assertTrue(db_manager.insert_cpu_specs(make_cpu(3)))
+        self.assertTrue(db_manager.insert_cpu_specs(make_cpu(4)))
+        
+        # Pooled reads see every write
+        self.assertEqual(db_manager.get_cpu_count(), 5)
+        self.assertEqual(len(db_manager.get_cpu_by_name('Mixed CPU')), 5)
+        self.assertEqual(db_manager.get_power_statistics()['power']['total_cpus_with_power_data'], 5)
+        
+        # And another batch still lands
+        self.assertEqual(db_manager.insert_cpu_specs_bulk([make_cpu(i) for i in range(4, 7)]), 2)
+        self.assertEqual(db_manager.get_cpu_count(), 7)
     
     def test_data_manager_operations(self):
         """Test file-based data operations."""
-        from data_manager import DataManager
-        
         data_manager = DataManager(self.temp_dir)
         
         # Test data to save
@@ -166,8 +296,6 @@ class TestCrawlerIntegration(unittest.TestCase):
     
     def test_utility_functions(self):
         """Test all utility functions work correctly."""
-        from utils import setup_logging, get_headers, validate_url, clean_text
-        
         # Test logging setup
         logger = setup_logging('INFO')
         self.assertIsNotNone(logger)
@@ -198,8 +326,6 @@ class TestCrawlerIntegration(unittest.TestCase):
     
     def test_parser_functionality(self):
         """Test parser core functionality."""
-        from parser import IntelCpuParser
-        
         parser = IntelCpuParser()
         
         # Test URL filtering (basic functionality)
@@ -217,8 +343,6 @@ class TestCrawlerIntegration(unittest.TestCase):
     @patch('requests.Session.get')
     def test_crawler_initialization_and_config(self, mock_get):
         """Test crawler initialization with different configurations."""
-        from crawler import IntelCpuCrawler
-        
         # Mock response for any HTTP requests during initialization
         mock_response = Mock()
         mock_response.status_code = 200
@@ -232,6 +356,7 @@ class TestCrawlerIntegration(unittest.TestCase):
             delay=0.1,
             max_pages=1
         )
+        self.addCleanup(crawler.close)
         
         self.assertEqual(crawler.output_dir, Path(self.temp_dir))
         self.assertEqual(crawler.delay, 0.1)
@@ -240,11 +365,33 @@ class TestCrawlerIntegration(unittest.TestCase):
         self.assertIsNotNone(crawler.parser)
         self.assertIsNotNone(crawler.data_manager)
     
+    def test_scrape_pages_isolates_failed_url(self):
+        """Test one URL raising a non-request error only loses that page."""
+        from urllib3.exceptions import LocationParseError
+        
+        spec_response = Mock()
+        spec_response.status_code = 200
+        spec_response.content = b'<html><head><title>Test CPU</title></head><body><h1>Test CPU</h1></body></html>'
+        spec_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        spec_response.encoding = 'utf-8'
+        
+        def fake_get(url, **kwargs):
+            if 'bad' in url:
+                raise LocationParseError(url)
+            return spec_response
+        
+        crawler = IntelCpuCrawler(config_path='config/config.yaml', output_dir=self.temp_dir, delay=0.0)
+        self.addCleanup(crawler.close)
+        urls = ['https://example.com/ok1', 'http://bad..host/', 'https://example.com/ok2']
+        
+        with patch('requests.Session.get', side_effect=fake_get):
+            results = list(crawler.scrape_pages(urls))
+        
+        self.assertEqual([url for url, _ in results], urls)
+        self.assertIsNone(results[1][1])
+    
     def test_end_to_end_workflow(self):
         """Test the complete workflow with mocked HTTP requests."""
-        from crawler import IntelCpuCrawler
-        from database_manager import PowerSpecDatabaseManager
-        
         # Create mock HTML content that parser can process
         mock_listing_html = '''
         <html>
@@ -292,8 +439,10 @@ class TestCrawlerIntegration(unittest.TestCase):
                 delay=0.0,  # No delay for testing
                 max_pages=1
             )
+            self.addCleanup(crawler.close)
             
             # Replace database with test database
+            crawler.db_manager.close()
             crawler.db_manager = PowerSpecDatabaseManager(self.test_db_path)
             
             # This would normally crawl, but our mocks will prevent actual HTTP requests
@@ -303,9 +452,6 @@ class TestCrawlerIntegration(unittest.TestCase):
     
     def test_cli_integration(self):
         """Test that CLI commands can be imported and have correct structure."""
-        # Test that main module can be imported
-        import main
-        
         # Test that click commands are properly defined
         self.assertTrue(hasattr(main, 'cli'))
         self.assertTrue(hasattr(main, 'crawl'))
@@ -374,12 +520,7 @@ class TestSystemHealth(unittest.TestCase):
     
     def test_configuration_validity(self):
         """Test that configuration files are valid."""
-        import yaml
-        
-        config_path = Path(__file__).parent.parent / 'config' / 'config.yaml'
-        
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _load_config()
         
         # Test required configuration keys
         required_keys = ['base_urls', 'user_agent', 'database']